@@ -0,0 +1,37 @@
+"""Migration script to add soft delete columns to existing tables.
+"""
+from sqlalchemy import text
+from app.infrastructure.database.connection import engine
+
+# Tables whose models use SoftDeleteMixin
+TABLES = [
+    "notifications",
+    "chat_messages",
+    "industrial_placements",
+    "geofences",
+]
+
+COLUMNS = [
+    "is_deleted BOOLEAN DEFAULT FALSE NOT NULL",
+    "deleted_at TIMESTAMP",
+]
+
+def add_soft_delete_columns():
+    with engine.connect() as conn:
+        for table in TABLES:
+            print(f"Adding soft delete columns to {table} table...")
+            for column in COLUMNS:
+                try:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column}"))
+                    conn.commit()
+                    print(f"Column {column.split()[0]} added successfully.")
+                except Exception as e:
+                    conn.rollback()
+                    message = str(e).lower()
+                    if "duplicate column name" in message or "already exists" in message:
+                        print(f"Column {column.split()[0]} already exists.")
+                    else:
+                        print(f"Error adding column: {e}")
+
+if __name__ == "__main__":
+    add_soft_delete_columns()
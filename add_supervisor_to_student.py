@@ -21,10 +21,18 @@ def migrate():
         result = db.execute(check_sql).fetchone()
         
         if not result:
+            # Match users.id, which is VARCHAR(36) until convert_ids_to_uuid.py runs
+            id_type = db.execute(text("""
+                SELECT data_type 
+                FROM information_schema.columns 
+                WHERE table_name='users' AND column_name='id'
+            """)).scalar()
+            column_type = "UUID" if id_type == "uuid" else "VARCHAR(36)"
+            
             # Add column
-            sql = text("""
+            sql = text(f"""
                 ALTER TABLE student_profiles 
-                ADD COLUMN assigned_supervisor_id VARCHAR(36) 
+                ADD COLUMN assigned_supervisor_id {column_type} 
                 REFERENCES users(id);
             """)
             db.execute(sql)
@@ -0,0 +1,41 @@
+"""Migration script to add denormalized unread counters to the users table.
+"""
+from sqlalchemy import text
+from app.infrastructure.database.connection import engine, get_db_session
+from app.infrastructure.repositories.user import UserRepository
+
+COLUMNS = [
+    "unread_chat_count INTEGER DEFAULT 0 NOT NULL",
+    "unread_notification_count INTEGER DEFAULT 0 NOT NULL",
+]
+
+def add_unread_count_columns():
+    print("Adding unread count columns to users table...")
+    with engine.connect() as conn:
+        for column in COLUMNS:
+            try:
+                conn.execute(text(f"ALTER TABLE users ADD COLUMN {column}"))
+                conn.commit()
+                print(f"Column {column.split()[0]} added successfully.")
+            except Exception as e:
+                conn.rollback()
+                message = str(e).lower()
+                if "duplicate column name" in message or "already exists" in message:
+                    print(f"Column {column.split()[0]} already exists.")
+                else:
+                    print(f"Error adding column: {e}")
+
+    # Backfill the counters from existing messages and notifications
+    db = get_db_session()
+    try:
+        updated = UserRepository(db).reconcile_unread_counts()
+        db.commit()
+        print(f"Backfilled unread counts for {updated} users.")
+    except Exception as e:
+        print(f"Error backfilling unread counts: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    add_unread_count_columns()
@@ -0,0 +1,19 @@
+"""Migration script to index users.role for role-filtered user listings.
+"""
+from sqlalchemy import text
+from app.infrastructure.database.connection import engine
+
+def add_user_role_index():
+    print("Adding index on users.role...")
+    with engine.connect() as conn:
+        try:
+            # Same name create_all() gives the index declared on User.role
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_role ON users (role)"))
+            conn.commit()
+            print("Index ix_users_role is in place.")
+        except Exception as e:
+            conn.rollback()
+            print(f"Error adding index: {e}")
+
+if __name__ == "__main__":
+    add_user_role_index()
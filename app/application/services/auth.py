@@ -19,12 +19,19 @@ Example:
     ...     )
 """
 
+from datetime import datetime
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
 from app.domain.models.user import User, UserRole
 from app.infrastructure.repositories.user import UserRepository
-from app.infrastructure.security.password import hash_password, verify_password, needs_rehash
+from app.infrastructure.security.password import (
+    hash_password,
+    verify_password,
+    ahash_password,
+    averify_password,
+    needs_rehash,
+)
 from app.infrastructure.security.session import create_session
 
 
@@ -89,16 +96,7 @@ class AuthService:
             ...     level=400
             ... )
         """
-        # Check if email already exists
-        if self.user_repo.exists({"email": email}):
-            raise ValueError(f"Email {email} is already registered")
-        
-        # Validate email format
-        if "@" not in email:
-            raise ValueError("Invalid email format")
-        
-        # Hash password
-        password_hash = hash_password(password)
+        password_hash = self._prepare_registration(email, password)
         
         # Prepare user data
         user_data = {
@@ -155,16 +153,7 @@ class AuthService:
             ...     staff_id="STAFF001"
             ... )
         """
-        # Check if email already exists
-        if self.user_repo.exists({"email": email}):
-            raise ValueError(f"Email {email} is already registered")
-        
-        # Validate email format
-        if "@" not in email:
-            raise ValueError("Invalid email format")
-        
-        # Hash password
-        password_hash = hash_password(password)
+        password_hash = self._prepare_registration(email, password)
         
         # Prepare user data
         user_data = {
@@ -186,6 +175,35 @@ class AuthService:
         
         return user
     
+    def _prepare_registration(self, email: str, password: str) -> str:
+        """Validate a signup and hash its password.
+        
+        The password is hashed before the first query: once the session has
+        checked out a pooled connection it holds it until commit, and bcrypt
+        would keep it busy for the whole key derivation.
+        
+        Args:
+            email: New user's email address
+            password: Plain text password
+        
+        Returns:
+            The password hash to store
+        
+        Raises:
+            ValueError: If the email is malformed or already registered
+        """
+        # Validate email format
+        if "@" not in email:
+            raise ValueError("Invalid email format")
+        
+        password_hash = hash_password(password)
+        
+        # Check if email already exists
+        if self.user_repo.exists({"email": email}):
+            raise ValueError(f"Email {email} is already registered")
+        
+        return password_hash
+    
     def login(self, email: str, password: str) -> Dict[str, Any]:
         """Authenticate a user and create a session.
         
@@ -207,23 +225,87 @@ class AuthService:
             >>> user = result['user']
             >>> session_data = result['session']
         """
-        # Get user by email
-        user = self.user_repo.get_by_email(email)
+        user = self._get_login_user(email)
         
-        if not user:
+        # Verify password
+        if not verify_password(password, user.password_hash):
             raise ValueError("Invalid email or password")
         
+        # Rehash with current work factor if needed
+        new_hash = None
+        if needs_rehash(user.password_hash):
+            new_hash = hash_password(password)
+        
+        return self._complete_login(user, new_hash)
+    
+    async def alogin(self, email: str, password: str) -> Dict[str, Any]:
+        """Authenticate a user and create a session from async code.
+        
+        Same contract as login(), but the bcrypt verify (and any rehash)
+        runs in a worker thread so the event loop keeps serving other
+        requests while the password is checked.
+        
+        Args:
+            email: User's email address
+            password: Plain text password
+        
+        Returns:
+            Dictionary containing user, session and needs_rehash (see login)
+        
+        Raises:
+            ValueError: If credentials are invalid
+        
+        Example:
+            >>> result = await service.alogin("student@university.edu", "password123")
+        """
+        user = self._get_login_user(email)
+        
         # Verify password
-        if not verify_password(password, user.password_hash):
+        if not await averify_password(password, user.password_hash):
             raise ValueError("Invalid email or password")
         
-        # Check if password needs rehashing
-        should_rehash = needs_rehash(user.password_hash)
+        # Rehash with current work factor if needed
+        new_hash = None
+        if needs_rehash(user.password_hash):
+            new_hash = await ahash_password(password)
         
-        if should_rehash:
-            # Rehash with current work factor
-            new_hash = hash_password(password)
-            self.user_repo.update(user.id, {"password_hash": new_hash})
+        return self._complete_login(user, new_hash)
+    
+    def _get_login_user(self, email: str) -> User:
+        """Look up the user signing in, shared by login() and alogin().
+        
+        Args:
+            email: User's email address
+        
+        Returns:
+            The User with that email
+        
+        Raises:
+            ValueError: If no user has that email (same message as a wrong
+                password, so the response doesn't reveal which one failed)
+        """
+        user = self.user_repo.get_by_email(email)
+        
+        if not user:
+            raise ValueError("Invalid email or password")
+        
+        return user
+    
+    def _complete_login(self, user: User, new_hash: Optional[str]) -> Dict[str, Any]:
+        """Record a verified login and create its session.
+        
+        Args:
+            user: The user whose password has been verified
+            new_hash: Replacement password hash, or None if the stored one
+                is still current
+        
+        Returns:
+            Dictionary containing user, session and needs_rehash (see login)
+        """
+        updates: Dict[str, Any] = {"last_login_at": datetime.utcnow()}
+        if new_hash:
+            updates["password_hash"] = new_hash
+        self.user_repo.update(user.id, updates)
         
         # Create session
         session_data = create_session(user)
@@ -231,7 +313,7 @@ class AuthService:
         return {
             "user": user,
             "session": session_data,
-            "needs_rehash": should_rehash
+            "needs_rehash": new_hash is not None
         }
     
     def change_password(
@@ -278,11 +360,17 @@ class AuthService:
         
         return True
     
-    def get_user_with_profile(self, user_id: str) -> Optional[User]:
+    def get_user_with_profile(
+        self,
+        user_id: str,
+        role: Optional[UserRole] = None
+    ) -> Optional[User]:
         """Get a user with their profile loaded.
         
         Args:
             user_id: User's unique identifier
+            role: User's role if already known (e.g. from the session), so
+                only the matching profile is loaded
         
         Returns:
             User instance with profile, or None if not found
@@ -292,7 +380,7 @@ class AuthService:
             >>> if user.role == UserRole.STUDENT:
             ...     print(user.student_profile.matric_number)
         """
-        return self.user_repo.get_user_with_profile(user_id)
+        return self.user_repo.get_user_with_profile(user_id, role)
     
     def update_profile(
         self,
@@ -317,8 +405,8 @@ class AuthService:
             ...     profile_data={"phone_number": "+234-123-4567"}
             ... )
         """
-        # Get user
-        user = self.user_repo.get_by_id(user_id)
+        # Get user and both profiles in one query (role not known yet)
+        user = self.user_repo.get_user_with_profile(user_id)
         
         if not user:
             raise ValueError("User not found")
@@ -336,17 +424,16 @@ class AuthService:
         # Update profile fields
         if profile_data:
             if user.role == UserRole.STUDENT:
-                profile = self.user_repo.get_student_profile(user_id)
-                if profile:
-                    for key, value in profile_data.items():
-                        if hasattr(profile, key):
-                            setattr(profile, key, value)
+                profile = user.student_profile
             elif user.role == UserRole.SUPERVISOR:
-                profile = self.user_repo.get_supervisor_profile(user_id)
-                if profile:
-                    for key, value in profile_data.items():
-                        if hasattr(profile, key):
-                            setattr(profile, key, value)
+                profile = user.supervisor_profile
+            else:
+                profile = None
+            
+            if profile:
+                for key, value in profile_data.items():
+                    if hasattr(profile, key):
+                        setattr(profile, key, value)
             
             self.db.flush()
         
@@ -58,8 +58,10 @@ class GeofenceValidationService:
         
         Returns:
             Dictionary containing:
-                - is_valid: Whether location is within geofence
-                - location_status: LocationStatus enum value
+                - is_valid: Whether location is within geofence (True when
+                  the placement has no geofence)
+                - location_status: LocationStatus enum value, by the same
+                  rules as GeofenceService.get_location_status
                 - distance_from_center: Distance in meters
                 - geofence_radius: Geofence radius in meters
                 - message: Human-readable validation message
@@ -93,32 +95,39 @@ class GeofenceValidationService:
                 "message": "No geofence defined for this placement"
             }
         
-        # Calculate distance and validate
+        geofence = placement.geofence
+        
+        # One pass gives both the distance and the verdict; the containment
+        # metric is the one used everywhere else (log lists, bulk re-checks)
         distance, is_within = self.geofence_service.calculate_distance_from_geofence(
             latitude=log.latitude,
             longitude=log.longitude,
-            geofence=placement.geofence
+            geofence=geofence
         )
         
-        # Determine location status
-        location_status = self.geofence_service.get_location_status(
-            latitude=log.latitude,
-            longitude=log.longitude,
-            geofence=placement.geofence
-        )
+        # Same rules as GeofenceService.get_location_status
+        if log.latitude == 0 and log.longitude == 0:
+            location_status = LocationStatus.UNKNOWN
+        elif is_within:
+            location_status = LocationStatus.WITHIN
+        else:
+            location_status = LocationStatus.OUTSIDE
+        is_valid = location_status == LocationStatus.WITHIN
         
         # Generate message
-        if is_within:
+        if location_status == LocationStatus.UNKNOWN:
+            message = "Location was not captured for this log"
+        elif is_valid:
             message = f"Location is within geofence ({distance:.0f}m from center)"
         else:
-            distance_outside = distance - placement.geofence.radius_meters
+            distance_outside = max(distance - geofence.radius_meters, 0)
             message = f"Location is outside geofence ({distance_outside:.0f}m beyond boundary)"
         
         return {
-            "is_valid": is_within,
+            "is_valid": is_valid,
             "location_status": location_status,
             "distance_from_center": distance,
-            "geofence_radius": placement.geofence.radius_meters,
+            "geofence_radius": geofence.radius_meters,
             "message": message
         }
     
@@ -128,35 +137,40 @@ class GeofenceValidationService:
     ) -> Dict[str, Any]:
         """Get all logs that are outside the geofence for a placement.
         
+        Logs are checked against the placement's current geofence, so the
+        report stays correct after the geofence is moved or resized.
+        
         Args:
             placement_id: Placement ID
         
         Returns:
             Dictionary containing:
                 - total_logs: Total number of logs
+                - located_logs: Logs with usable coordinates (not null or
+                  (0, 0)); only these can be checked
+                - unlocated_logs: Logs that could not be checked
                 - violations: Number of logs outside geofence
-                - violation_rate: Percentage of violations
+                - violation_rate: Percentage of located logs outside the
+                  geofence
                 - violation_logs: List of log IDs outside geofence
         
         Example:
             >>> report = service.get_placement_violations(placement_id)
             >>> print(f"Violation rate: {report['violation_rate']:.1f}%")
         """
-        # Get all logs for placement
-        all_logs = self.log_repo.get_all({"placement_id": placement_id})
+        total_logs, located_logs = self.log_repo.count_located_logs(placement_id)
         
-        # Get logs outside geofence
-        outside_logs = self.log_repo.get_logs_by_location_status(
-            placement_id=placement_id,
-            location_status=LocationStatus.OUTSIDE
-        )
+        # Distance check runs in the database against the current geofence
+        outside_logs = self.log_repo.get_logs_outside_geofence(placement_id)
         
-        total_logs = len(all_logs)
+        # Rate over the logs that could be checked, the same set as above
         violations = len(outside_logs)
-        violation_rate = (violations / total_logs * 100) if total_logs > 0 else 0
+        violation_rate = (violations / located_logs * 100) if located_logs > 0 else 0
         
         return {
             "total_logs": total_logs,
+            "located_logs": located_logs,
+            "unlocated_logs": total_logs - located_logs,
             "violations": violations,
             "violation_rate": violation_rate,
             "violation_logs": [log.id for log in outside_logs]
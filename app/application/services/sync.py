@@ -82,14 +82,20 @@ class SyncService:
         failed = 0
         errors = []
         
+        # Look up every already-synced UUID in the batch with one query
+        existing_uuids = self.log_repo.exists_by_client_uuids([
+            log_data["client_uuid"]
+            for log_data in offline_logs
+            if log_data.get("client_uuid")
+        ])
+        
         for log_data in offline_logs:
             try:
                 # Check if already synced (idempotency)
                 client_uuid = log_data.get("client_uuid")
                 
                 if client_uuid:
-                    existing_log = self.log_repo.get_by_client_uuid(client_uuid)
-                    if existing_log:
+                    if client_uuid in existing_uuids:
                         skipped += 1
                         continue
                 
@@ -113,6 +119,9 @@ class SyncService:
                     challenges=log_data.get("challenges")
                 )
                 
+                # Skip repeats of this UUID later in the same batch
+                if client_uuid:
+                    existing_uuids.add(client_uuid)
                 synced += 1
                 
             except Exception as e:
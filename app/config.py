@@ -21,6 +21,9 @@ class Settings(BaseSettings):
     Attributes:
         database_url: PostgreSQL connection string for production.
         database_url_dev: SQLite connection string for development.
+        db_pool_size: Persistent PostgreSQL connections kept in the pool.
+        db_max_overflow: Extra connections allowed above the pool size.
+        db_pool_recycle_seconds: Age after which pooled connections are replaced.
         secret_key: Secret key for session encryption and security.
         session_lifetime_hours: Session expiration time in hours.
         geofence_default_radius_meters: Default geofence radius.
@@ -47,6 +50,23 @@ class Settings(BaseSettings):
         default="sqlite:///./siwes_dev.db",
         description="SQLite connection URL for development"
     )
+    db_pool_size: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="PostgreSQL connection pool size (1-100)"
+    )
+    db_max_overflow: int = Field(
+        default=40,
+        ge=0,
+        le=200,
+        description="Connections allowed beyond the pool size (0-200)"
+    )
+    db_pool_recycle_seconds: int = Field(
+        default=1800,
+        ge=60,
+        description="Recycle pooled connections older than this (seconds)"
+    )
     
     # Security
     secret_key: str = Field(
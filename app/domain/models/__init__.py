@@ -25,7 +25,7 @@ Usage:
     >>> Base.metadata.create_all(engine)
 """
 
-from .base import Base, TimestampMixin, SoftDeleteMixin
+from .base import Base, GUID, parse_guid, TimestampMixin, SoftDeleteMixin
 from .user import User, UserRole, StudentProfile, SupervisorProfile
 from .placement import IndustrialPlacement, Geofence
 from .log import DailyLog, LogStatus, LocationStatus
@@ -34,6 +34,8 @@ from .chat import ChatMessage, Notification, NotificationType
 __all__ = [
     # Base classes
     "Base",
+    "GUID",
+    "parse_guid",
     "TimestampMixin",
     "SoftDeleteMixin",
     # User models
@@ -10,7 +10,7 @@ from datetime import datetime
 import uuid
 
 from app.infrastructure.database.connection import Base
-from app.domain.models.base import TimestampMixin
+from app.domain.models.base import GUID, TimestampMixin
 
 
 class CallLog(Base, TimestampMixin):
@@ -47,7 +47,7 @@ class CallLog(Base, TimestampMixin):
     __tablename__ = "call_logs"
     
     id = Column(
-        String(36),
+        GUID(),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         comment="Unique call log identifier (UUID format)"
@@ -65,14 +65,14 @@ class CallLog(Base, TimestampMixin):
         comment="Full URL to join the Daily.co room"
     )
     student_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('users.id'),
         nullable=False,
         index=True,
         comment="Foreign key to student user"
     )
     supervisor_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('users.id'),
         nullable=False,
         index=True,
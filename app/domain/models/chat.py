@@ -9,13 +9,12 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Enum
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Enum, Index, text
 from sqlalchemy.orm import relationship
 
-from .base import Base, TimestampMixin
+from .base import Base, GUID, TimestampMixin, SoftDeleteMixin
 
-
-class ChatMessage(Base, TimestampMixin):
+class ChatMessage(Base, TimestampMixin, SoftDeleteMixin):
     """Chat message entity for student-supervisor communication.
     
     Represents a single text message in the real-time chat system.
@@ -29,6 +28,8 @@ class ChatMessage(Base, TimestampMixin):
         message_body: Text content of the message.
         is_read: Whether receiver has read the message.
         delivered_at: Timestamp when message was delivered (nullable).
+        is_deleted: Soft delete flag (see SoftDeleteMixin).
+        deleted_at: UTC timestamp when soft-deleted (nullable).
         sender: Related User entity (message sender).
         receiver: Related User entity (message receiver).
     
@@ -53,23 +54,21 @@ class ChatMessage(Base, TimestampMixin):
     __tablename__ = "chat_messages"
     
     id = Column(
-        String(36),
+        GUID(),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         comment="Unique message identifier (UUID)"
     )
     sender_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('users.id'),
         nullable=False,
-        index=True,
         comment="Foreign key to user who sent message"
     )
     receiver_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('users.id'),
         nullable=False,
-        index=True,
         comment="Foreign key to user who receives message"
     )
     message_body = Column(
@@ -100,6 +99,22 @@ class ChatMessage(Base, TimestampMixin):
         foreign_keys=[receiver_id],
         backref="received_messages"
     )
+    
+    # Composite indexes covering both directions of a conversation thread
+    # (their leading columns also serve sender_id / receiver_id lookups)
+    __table_args__ = (
+        Index('idx_sender_receiver_created', 'sender_id', 'receiver_id', 'created_at'),
+        Index('idx_receiver_sender_created', 'receiver_id', 'sender_id', 'created_at'),
+        # Partial index over unread, non-deleted rows only (unread lists,
+        # mark-as-read and counter reconciliation)
+        Index(
+            'idx_chat_unread_receiver_sender',
+            'receiver_id',
+            'sender_id',
+            postgresql_where=text('is_read = false AND deleted_at IS NULL'),
+            sqlite_where=text('is_read = 0 AND deleted_at IS NULL'),
+        ),
+    )
 
 
 class NotificationType(enum.Enum):
@@ -126,7 +141,7 @@ class NotificationType(enum.Enum):
     SYSTEM_ANNOUNCEMENT = "system_announcement"
 
 
-class Notification(Base, TimestampMixin):
+class Notification(Base, TimestampMixin, SoftDeleteMixin):
     """User notification entity.
     
     Represents a system notification for important events that require
@@ -142,6 +157,8 @@ class Notification(Base, TimestampMixin):
         is_read: Whether user has read the notification.
         related_log_id: Foreign key to related DailyLog (nullable).
         action_url: URL to navigate when notification is clicked (nullable).
+        is_deleted: Soft delete flag (see SoftDeleteMixin).
+        deleted_at: UTC timestamp when soft-deleted (nullable).
         user: Related User entity.
         related_log: Related DailyLog entity (if applicable).
     
@@ -169,13 +186,13 @@ class Notification(Base, TimestampMixin):
     __tablename__ = "notifications"
     
     id = Column(
-        String(36),
+        GUID(),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         comment="Unique notification identifier (UUID)"
     )
     user_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('users.id'),
         nullable=False,
         index=True,
@@ -204,7 +221,7 @@ class Notification(Base, TimestampMixin):
         comment="Whether user has read the notification"
     )
     related_log_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('daily_logs.id'),
         nullable=True,
         comment="Foreign key to related log (if applicable)"
@@ -218,3 +235,14 @@ class Notification(Base, TimestampMixin):
     # Relationships
     user = relationship("User", backref="notifications")
     related_log = relationship("DailyLog", backref="notifications")
+    
+    # Partial index over unread, non-deleted rows only (unread lists,
+    # mark-all-as-read and counter reconciliation)
+    __table_args__ = (
+        Index(
+            'idx_notification_unread_user',
+            'user_id',
+            postgresql_where=text('is_read = false AND deleted_at IS NULL'),
+            sqlite_where=text('is_read = 0 AND deleted_at IS NULL'),
+        ),
+    )
@@ -14,7 +14,7 @@ from typing import Optional
 from sqlalchemy import Column, String, Date, Text, Float, DateTime, ForeignKey, Enum, Index, Integer
 from sqlalchemy.orm import relationship
 
-from .base import Base, TimestampMixin
+from .base import Base, GUID, TimestampMixin
 
 
 class LogStatus(enum.Enum):
@@ -109,7 +109,7 @@ class DailyLog(Base, TimestampMixin):
     __tablename__ = "daily_logs"
     
     id = Column(
-        String(36),
+        GUID(),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         comment="Server-generated unique identifier (UUID)"
@@ -122,14 +122,14 @@ class DailyLog(Base, TimestampMixin):
         comment="Client-generated UUID for sync idempotency"
     )
     student_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('users.id'),
         nullable=False,
         index=True,
         comment="Foreign key to student user"
     )
     placement_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('industrial_placements.id'),
         nullable=False,
         comment="Foreign key to industrial placement"
@@ -194,7 +194,7 @@ class DailyLog(Base, TimestampMixin):
         comment="UTC timestamp when reviewed by supervisor"
     )
     reviewer_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('users.id'),
         nullable=True,
         comment="Foreign key to supervisor who reviewed"
@@ -219,7 +219,9 @@ class DailyLog(Base, TimestampMixin):
     # Composite indexes for common queries
     __table_args__ = (
         Index('idx_student_date', 'student_id', 'log_date'),
+        Index('idx_student_placement_date', 'student_id', 'placement_id', 'log_date'),
         Index('idx_student_week', 'student_id', 'week_number'),
         Index('idx_status_reviewed', 'status', 'reviewed_at'),
         Index('idx_placement_date', 'placement_id', 'log_date'),
+        Index('idx_placement_week', 'placement_id', 'week_number'),
     )
@@ -10,10 +10,10 @@ from typing import Optional, List
 from sqlalchemy import Column, String, Float, Integer, Text, ForeignKey
 from sqlalchemy.orm import relationship
 
-from .base import Base, TimestampMixin
+from .base import Base, GUID, TimestampMixin, SoftDeleteMixin
 
 
-class IndustrialPlacement(Base, TimestampMixin):
+class IndustrialPlacement(Base, TimestampMixin, SoftDeleteMixin):
     """Industrial placement assignment entity.
     
     Represents a company/organization where students complete their
@@ -26,6 +26,7 @@ class IndustrialPlacement(Base, TimestampMixin):
         address: Physical address of the placement location.
         supervisor_contact: Contact information for industrial supervisor.
         geofence_id: Foreign key to associated Geofence (1-to-1).
+        is_deleted / deleted_at: Soft delete state (see SoftDeleteMixin).
         geofence: Related Geofence entity.
         students: Collection of students assigned to this placement.
     
@@ -48,7 +49,7 @@ class IndustrialPlacement(Base, TimestampMixin):
     __tablename__ = "industrial_placements"
     
     id = Column(
-        String(36),
+        GUID(),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         comment="Unique placement identifier (UUID format)"
@@ -69,7 +70,7 @@ class IndustrialPlacement(Base, TimestampMixin):
         comment="Industrial supervisor contact (email or phone)"
     )
     geofence_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('geofences.id'),
         nullable=False,
         unique=True,
@@ -88,7 +89,7 @@ class IndustrialPlacement(Base, TimestampMixin):
     )
 
 
-class Geofence(Base, TimestampMixin):
+class Geofence(Base, TimestampMixin, SoftDeleteMixin):
     """Geofence boundary definition for location validation.
     
     Defines a circular boundary centered on the industrial placement
@@ -100,6 +101,7 @@ class Geofence(Base, TimestampMixin):
         latitude: Center point latitude in decimal degrees (-90 to 90).
         longitude: Center point longitude in decimal degrees (-180 to 180).
         radius_meters: Radius of geofence circle in meters.
+        is_deleted / deleted_at: Soft delete state (see SoftDeleteMixin).
         placement: Related IndustrialPlacement entity.
     
     Example:
@@ -125,7 +127,7 @@ class Geofence(Base, TimestampMixin):
     __tablename__ = "geofences"
     
     id = Column(
-        String(36),
+        GUID(),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         comment="Unique geofence identifier (UUID format)"
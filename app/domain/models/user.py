@@ -9,10 +9,10 @@ import uuid
 from datetime import datetime, date
 from typing import Optional
 
-from sqlalchemy import Column, String, Boolean, Enum, DateTime, ForeignKey, Date, Text
+from sqlalchemy import Column, String, CHAR, Boolean, Enum, DateTime, ForeignKey, Date, Text, Integer
 from sqlalchemy.orm import relationship, backref
 
-from .base import Base, TimestampMixin
+from .base import Base, GUID, TimestampMixin
 
 
 class UserRole(enum.Enum):
@@ -45,6 +45,8 @@ class User(Base, TimestampMixin):
         role: User's role determining permissions and UI access.
         is_active: Whether account is active and can authenticate.
         last_login_at: Timestamp of most recent successful login (UTC).
+        unread_chat_count: Denormalized count of unread chat messages.
+        unread_notification_count: Denormalized count of unread notifications.
         student_profile: Related StudentProfile if role is STUDENT (1-to-1).
         supervisor_profile: Related SupervisorProfile if role is SUPERVISOR (1-to-1).
     
@@ -64,12 +66,15 @@ class User(Base, TimestampMixin):
         - Email must be unique and is case-insensitive
         - Password must be hashed using bcrypt before storage
         - Inactive users cannot log in but data is preserved
+        - Unread counters are kept in step by the chat and notification
+          repositories; UserRepository.reconcile_unread_counts() corrects
+          any drift (e.g. after soft deletes)
     """
     
     __tablename__ = "users"
     
     id = Column(
-        String(36),
+        GUID(),
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
         comment="Unique user identifier (UUID format)"
@@ -82,9 +87,9 @@ class User(Base, TimestampMixin):
         comment="User email address (login credential, case-insensitive)"
     )
     password_hash = Column(
-        String(255),
+        CHAR(60),
         nullable=False,
-        comment="Bcrypt hashed password (never store plaintext)"
+        comment="Bcrypt hashed password, always 60 ASCII chars (never store plaintext)"
     )
     full_name = Column(
         String(100),
@@ -94,6 +99,7 @@ class User(Base, TimestampMixin):
     role = Column(
         Enum(UserRole),
         nullable=False,
+        index=True,
         comment="User role determining permissions (student or supervisor)"
     )
     is_active = Column(
@@ -107,9 +113,37 @@ class User(Base, TimestampMixin):
         nullable=True,
         comment="UTC timestamp of last successful login"
     )
-
-
-
+    unread_chat_count = Column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Unread chat messages received (maintained by ChatRepository)"
+    )
+    unread_notification_count = Column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Unread notifications (maintained by NotificationRepository)"
+    )
+    
+    # Relationships (profiles are owned by the user; the database cascades
+    # deletes via ON DELETE CASCADE)
+    student_profile = relationship(
+        "StudentProfile",
+        foreign_keys="StudentProfile.user_id",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+    supervisor_profile = relationship(
+        "SupervisorProfile",
+        foreign_keys="SupervisorProfile.user_id",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
 
 
 class StudentProfile(Base, TimestampMixin):
@@ -151,7 +185,7 @@ class StudentProfile(Base, TimestampMixin):
     __tablename__ = "student_profiles"
     
     user_id = Column(
-        String(36),
+        GUID(),
         ForeignKey(User.id, ondelete='CASCADE'),
         primary_key=True,
         comment="Foreign key to users table (1-to-1 relationship)"
@@ -184,13 +218,13 @@ class StudentProfile(Base, TimestampMixin):
         comment="SIWES training period end date (typically start + 25 weeks)"
     )
     placement_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('industrial_placements.id'),
         nullable=True,
         comment="Foreign key to industrial placement (nullable until assigned)"
     )
     assigned_supervisor_id = Column(
-        String(36),
+        GUID(),
         ForeignKey('users.id'),
         nullable=True,
         comment="Foreign key to university supervisor"
@@ -233,7 +267,7 @@ class SupervisorProfile(Base, TimestampMixin):
     __tablename__ = "supervisor_profiles"
     
     user_id = Column(
-        String(36),
+        GUID(),
         ForeignKey(User.id, ondelete='CASCADE'),
         primary_key=True,
         comment="Foreign key to users table (1-to-1 relationship)"
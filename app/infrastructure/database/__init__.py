@@ -15,6 +15,7 @@ from .connection import (
     get_db_session,
     init_db,
     drop_db,
+    count_queries,
 )
 
 __all__ = [
@@ -24,4 +25,5 @@ __all__ = [
     "get_db_session",
     "init_db",
     "drop_db",
+    "count_queries",
 ]
@@ -11,6 +11,7 @@ Modules:
     log: Daily log repository
     chat: Chat message repository
     notification: Notification repository
+    dashboard: Cross-table dashboard summary repository
 """
 
 from app.infrastructure.repositories.base import BaseRepository
@@ -19,6 +20,7 @@ from app.infrastructure.repositories.placement import PlacementRepository
 from app.infrastructure.repositories.log import LogRepository
 from app.infrastructure.repositories.chat import ChatRepository
 from app.infrastructure.repositories.notification import NotificationRepository
+from app.infrastructure.repositories.dashboard import DashboardRepository
 
 __all__ = [
     "BaseRepository",
@@ -27,4 +29,5 @@ __all__ = [
     "LogRepository",
     "ChatRepository",
     "NotificationRepository",
+    "DashboardRepository",
 ]
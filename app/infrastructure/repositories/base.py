@@ -11,18 +11,38 @@ Example:
     >>> user = repo.get_by_id("123e4567-e89b-12d3-a456-426614174000")
 """
 
-from typing import TypeVar, Generic, Type, Optional, List, Dict, Any
+from functools import lru_cache
+from typing import TypeVar, Generic, Type, Optional, List, Dict, Any, FrozenSet
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy import String, and_, any_, cast, func, insert, inspect, literal, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.sql.elements import ColumnElement
 
-from app.domain.models.base import Base
+from app.domain.models.base import Base, parse_guid
 
 # Type variable for domain models
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+@lru_cache(maxsize=None)
+def _mapped_attributes(model: Type[Base]) -> FrozenSet[str]:
+    """Get the names of all mapped attributes on a model.
+    
+    Resolved once per model class so that updates can validate keys with a
+    set lookup instead of probing the instance with hasattr() per field.
+    
+    Args:
+        model: The SQLAlchemy model class to inspect
+    
+    Returns:
+        Frozen set of mapped column and relationship attribute names
+    """
+    return frozenset(inspect(model).attrs.keys())
+
+
 class BaseRepository(Generic[ModelType]):
     """Generic repository for database operations.
     
@@ -78,9 +98,52 @@ class BaseRepository(Generic[ModelType]):
         instance = self.model(**data)
         self.db.add(instance)
         self.db.flush()
-        self.db.refresh(instance)
+        self._refresh_expired(instance)
         return instance
     
+    def _refresh_expired(self, instance: ModelType) -> None:
+        """Reload attributes left unloaded by the last flush.
+        
+        Database-generated values that were not returned by the INSERT or
+        UPDATE (e.g. ``updated_at = now()``) are expired after flush. Only
+        those columns are re-selected; nothing is fetched when the instance
+        is already fully loaded.
+        
+        Args:
+            instance: The flushed model instance
+        """
+        expired = inspect(instance).expired_attributes
+        if expired:
+            self.db.refresh(instance, attribute_names=expired)
+    
+    def create_many(self, data: List[Dict[str, Any]]) -> List[ModelType]:
+        """Create multiple records in a single batched INSERT.
+        
+        Emits one multi-row ``INSERT ... RETURNING`` instead of a flush and
+        refresh per record. Python-side column defaults (UUID ids,
+        timestamps) are still applied to every row.
+        
+        Args:
+            data: List of field-value dictionaries, one per record
+        
+        Returns:
+            The created model instances, in the same order as ``data``
+        
+        Example:
+            >>> users = repo.create_many([
+            ...     {"email": "a@example.com", "full_name": "Ada"},
+            ...     {"email": "b@example.com", "full_name": "Bola"}
+            ... ])
+        """
+        if not data:
+            return []
+        
+        stmt = insert(self.model).returning(
+            self.model,
+            sort_by_parameter_order=True
+        )
+        return list(self.db.scalars(stmt, data).all())
+    
     def get_by_id(
         self,
         id: str | UUID,
@@ -93,12 +156,17 @@ class BaseRepository(Generic[ModelType]):
             include_deleted: Whether to include soft-deleted records
         
         Returns:
-            The model instance, or None if not found
+            The model instance, or None if not found or ``id`` is not a
+            valid UUID
         
         Example:
             >>> user = repo.get_by_id("123e4567-e89b-12d3-a456-426614174000")
         """
-        query = self.db.query(self.model).filter(self.model.id == str(id))
+        key = parse_guid(id)
+        if key is None:
+            return None
+        
+        query = self.db.query(self.model).filter(self.model.id == key)
         
         # Exclude soft-deleted records unless requested
         if not include_deleted and hasattr(self.model, 'deleted_at'):
@@ -106,6 +174,73 @@ class BaseRepository(Generic[ModelType]):
         
         return query.first()
     
+    def get_by_ids(
+        self,
+        ids: List[str | UUID],
+        include_deleted: bool = False
+    ) -> List[ModelType]:
+        """Get several records by ID in a single query.
+        
+        Instances already present in the session's identity map are reused;
+        the remaining IDs are fetched with one ``WHERE id IN (...)`` query.
+        
+        Args:
+            ids: The records' unique identifiers
+            include_deleted: Whether to include soft-deleted records
+        
+        Returns:
+            List of model instances in the order of ``ids``. IDs that were
+            not found, or are not valid UUIDs, are omitted.
+        
+        Example:
+            >>> users = repo.get_by_ids([student_id, supervisor_id])
+        """
+        keys = [key for key in map(parse_guid, ids) if key is not None]
+        found: Dict[str, ModelType] = {}
+        missing: List[str] = []
+        
+        for key in dict.fromkeys(keys):
+            instance = self.db.identity_map.get(identity_key(self.model, key))
+            if instance is None:
+                missing.append(key)
+            elif include_deleted or getattr(instance, 'deleted_at', None) is None:
+                found[key] = instance
+        
+        if missing:
+            query = self.db.query(self.model).filter(self._id_in(missing))
+            
+            # Exclude soft-deleted records unless requested
+            if not include_deleted and hasattr(self.model, 'deleted_at'):
+                query = query.filter(self.model.deleted_at.is_(None))
+            
+            for instance in query.all():
+                found[str(instance.id)] = instance
+        
+        return [found[key] for key in keys if key in found]
+    
+    def _id_in(self, ids: List[str | UUID]) -> ColumnElement[bool]:
+        """Build an ``id IN (...)`` predicate suited to the session's dialect.
+        
+        On PostgreSQL the IDs are sent as a single ``uuid[]`` parameter and
+        matched with ``id = ANY(...)``, so the statement text is the same for
+        any number of IDs and large batches stay clear of driver parameter
+        limits. Other dialects (SQLite in development) fall back to ``IN``.
+        
+        Args:
+            ids: The records' unique identifiers; values that are not valid
+                UUIDs are dropped, as they cannot match
+        
+        Returns:
+            SQL expression to use in a WHERE clause
+        """
+        keys = [key for key in map(parse_guid, ids) if key is not None]
+        
+        if self.db.get_bind().dialect.name == "postgresql":
+            return self.model.id == any_(
+                cast(literal(keys, ARRAY(String)), ARRAY(PG_UUID(as_uuid=False)))
+            )
+        return self.model.id.in_(keys)
+    
     def get_all(
         self,
         filters: Optional[Dict[str, Any]] = None,
@@ -174,12 +309,13 @@ class BaseRepository(Generic[ModelType]):
         if not instance:
             return None
         
+        attributes = _mapped_attributes(self.model)
         for key, value in data.items():
-            if hasattr(instance, key):
+            if key in attributes:
                 setattr(instance, key, value)
         
         self.db.flush()
-        self.db.refresh(instance)
+        self._refresh_expired(instance)
         return instance
     
     def delete(self, id: str | UUID, soft: bool = True) -> bool:
@@ -190,7 +326,7 @@ class BaseRepository(Generic[ModelType]):
             soft: Whether to soft delete (default) or hard delete
         
         Returns:
-            True if deleted, False if not found
+            True if deleted, False if not found (or already soft-deleted)
         
         Example:
             >>> # Soft delete (sets deleted_at)
@@ -198,18 +334,45 @@ class BaseRepository(Generic[ModelType]):
             >>> 
             >>> # Hard delete (removes from database)
             >>> repo.delete(user.id, soft=False)
+        
+        Note:
+            Soft delete applies to models with a deleted_at column and is a
+            single UPDATE that does not load the row; a copy already in the
+            session is expired so it reloads as deleted. Other models are
+            always hard deleted through the ORM, so relationship cascades
+            (e.g. nulling Notification.related_log_id) still run.
         """
-        instance = self.get_by_id(id)
-        if not instance:
+        key = parse_guid(id)
+        if key is None:
             return False
         
-        if soft and hasattr(instance, 'soft_delete'):
-            instance.soft_delete()
-        else:
+        if not (soft and hasattr(self.model, 'deleted_at')):
+            instance = self.get_by_id(key)
+            if not instance:
+                return False
+            
             self.db.delete(instance)
-        
-        self.db.flush()
-        return True
+            self.db.flush()
+            return True
+        
+        values: Dict[str, Any] = {"deleted_at": func.now()}
+        if hasattr(self.model, 'is_deleted'):
+            values["is_deleted"] = True
+        
+        stmt = update(self.model).where(
+            self.model.id == key,
+            self.model.deleted_at.is_(None)
+        ).values(**values)
+        result = self.db.execute(
+            stmt.execution_options(synchronize_session=False)
+        )
+        
+        # Don't leave a stale, undeleted copy in the identity map
+        instance = self.db.identity_map.get(identity_key(self.model, key))
+        if instance is not None:
+            self.db.expire(instance)
+        
+        return result.rowcount > 0
     
     def count(
         self,
@@ -11,12 +11,22 @@ Example:
     >>> unread_count = repo.count_unread_messages(user_id)
 """
 
-from typing import List
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import Row, or_, and_, bindparam, func, select, update
 
 from app.infrastructure.repositories.base import BaseRepository
+from app.infrastructure.repositories.user import UserRepository
 from app.domain.models.chat import ChatMessage
+from app.domain.models.user import User
+
+# Hot-path statements built once at import; callers bind parameters per call
+_UNREAD_COUNT_STMT = select(User.unread_chat_count).where(
+    User.id == bindparam("user_id")
+)
 
 
 class ChatRepository(BaseRepository[ChatMessage]):
@@ -37,6 +47,80 @@ class ChatRepository(BaseRepository[ChatMessage]):
             db: The database session for queries
         """
         super().__init__(ChatMessage, db)
+        self.user_repo = UserRepository(db)
+    
+    def create(self, data: Dict[str, Any]) -> ChatMessage:
+        """Create a message and bump the receiver's unread counter.
+        
+        Args:
+            data: Dictionary of ChatMessage field values
+        
+        Returns:
+            The created ChatMessage instance
+        
+        Example:
+            >>> msg = repo.create({
+            ...     "sender_id": student_id,
+            ...     "receiver_id": supervisor_id,
+            ...     "message_body": "Good morning sir"
+            ... })
+        """
+        message = super().create(data)
+        self._count_new_unread([message])
+        return message
+    
+    def create_many(self, data: List[Dict[str, Any]]) -> List[ChatMessage]:
+        """Create several messages and bump the receivers' unread counters.
+        
+        Args:
+            data: List of ChatMessage field dictionaries
+        
+        Returns:
+            The created ChatMessage instances, in the same order as ``data``
+        """
+        messages = super().create_many(data)
+        self._count_new_unread(messages)
+        return messages
+    
+    def _count_new_unread(self, messages: List[ChatMessage]) -> None:
+        """Add newly created unread messages to their receivers' counters.
+        
+        Args:
+            messages: Freshly inserted ChatMessage instances
+        """
+        self.user_repo.adjust_unread_counts(
+            "unread_chat_count",
+            Counter(m.receiver_id for m in messages if not m.is_read)
+        )
+    
+    def delete(self, id: str | UUID, soft: bool = True) -> bool:
+        """Delete a message and drop it from the unread counter if unread.
+        
+        Args:
+            id: The message's unique identifier
+            soft: Whether to soft delete (default) or hard delete
+        
+        Returns:
+            True if deleted, False if not found (or already soft-deleted)
+        
+        Example:
+            >>> repo.delete(message_id)
+        """
+        message = self.get_by_id(id)
+        if message is None:
+            return False
+        
+        # Read before deleting: the instance is expired or removed afterwards
+        receiver_id, is_read = message.receiver_id, message.is_read
+        if not super().delete(message.id, soft):
+            return False
+        
+        if not is_read:
+            self.user_repo.adjust_unread_counts(
+                "unread_chat_count",
+                {receiver_id: -1}
+            )
+        return True
     
     def get_conversation(
         self,
@@ -73,6 +157,54 @@ class ChatRepository(BaseRepository[ChatMessage]):
             ChatMessage.deleted_at.is_(None)
         ).order_by(ChatMessage.created_at).limit(limit).all()
     
+    def get_conversation_and_mark_read(
+        self,
+        reader_id: str,
+        other_user_id: str,
+        limit: int = 50
+    ) -> List[ChatMessage]:
+        """Mark a conversation as read and return its messages.
+        
+        Combines mark_conversation_as_read and get_conversation so opening a
+        thread costs one request and one transaction instead of two.
+        
+        Args:
+            reader_id: ID of the user opening the conversation
+            other_user_id: ID of the other participant
+            limit: Maximum number of messages to return (default: 50)
+        
+        Returns:
+            List of ChatMessage instances ordered by creation time
+        
+        Example:
+            >>> messages = repo.get_conversation_and_mark_read(
+            ...     reader_id=student_id,
+            ...     other_user_id=supervisor_id
+            ... )
+        
+        Note:
+            The UPDATE runs first and the reader's incoming messages are
+            marked is_read=True on the returned instances, including ones
+            loaded into the session before the call. A data-modifying CTE
+            would save one more round-trip on PostgreSQL, but is not
+            supported by SQLite and would bypass the unread counter
+            maintained by mark_conversation_as_read.
+        """
+        self.mark_conversation_as_read(
+            receiver_id=reader_id,
+            sender_id=other_user_id
+        )
+        messages = self.get_conversation(reader_id, other_user_id, limit)
+        
+        # The bulk UPDATE bypasses the identity map, so copies loaded earlier
+        # in this session still say unread; set the committed value directly
+        # so no extra UPDATE is flushed
+        for message in messages:
+            if message.receiver_id == reader_id and not message.is_read:
+                set_committed_value(message, "is_read", True)
+        
+        return messages
+    
     def get_user_messages(
         self,
         user_id: str,
@@ -98,6 +230,100 @@ class ChatRepository(BaseRepository[ChatMessage]):
             ChatMessage.deleted_at.is_(None)
         ).order_by(ChatMessage.created_at.desc()).limit(limit).all()
     
+    def get_user_messages_page(
+        self,
+        user_id: str,
+        before_id: Optional[str] = None,
+        limit: int = 50
+    ) -> List[ChatMessage]:
+        """Get one page of a user's messages using keyset pagination.
+        
+        Pages are selected by seeking past the last message of the previous
+        page rather than with OFFSET, so deep pages cost the same as the
+        first one.
+        
+        Args:
+            user_id: The user's ID
+            before_id: ID of the last message on the previous page, or None
+                for the first page
+            limit: Maximum number of messages to return (default: 50)
+        
+        Returns:
+            List of ChatMessage instances ordered by creation time descending
+        
+        Example:
+            >>> page = repo.get_user_messages_page(user_id)
+            >>> next_page = repo.get_user_messages_page(
+            ...     user_id,
+            ...     before_id=page[-1].id
+            ... )
+        
+        Note:
+            The cursor's created_at is resolved in SQL rather than bound
+            from Python, so the comparison always uses the stored value
+            (SQLite keeps CURRENT_TIMESTAMP without microseconds).
+        """
+        query = self.db.query(ChatMessage).filter(
+            or_(
+                ChatMessage.sender_id == user_id,
+                ChatMessage.receiver_id == user_id
+            ),
+            ChatMessage.deleted_at.is_(None)
+        )
+        
+        if before_id is not None:
+            cursor_created_at = select(ChatMessage.created_at).where(
+                ChatMessage.id == before_id
+            ).scalar_subquery()
+            
+            # Ties on created_at are broken by id, matching the ORDER BY
+            query = query.filter(
+                or_(
+                    ChatMessage.created_at < cursor_created_at,
+                    and_(
+                        ChatMessage.created_at == cursor_created_at,
+                        ChatMessage.id < before_id
+                    )
+                )
+            )
+        
+        return query.order_by(
+            ChatMessage.created_at.desc(),
+            ChatMessage.id.desc()
+        ).limit(limit).all()
+    
+    def iter_user_messages(
+        self,
+        user_id: str,
+        chunk_size: int = 500
+    ) -> Iterator[ChatMessage]:
+        """Stream every message sent to or from a user.
+        
+        Intended for exports: rows are fetched in chunks of ``chunk_size``
+        so memory stays bounded regardless of the total message count.
+        
+        Args:
+            user_id: The user's ID
+            chunk_size: Number of rows fetched per round-trip (default: 500)
+        
+        Yields:
+            ChatMessage instances ordered by creation time
+        
+        Example:
+            >>> for msg in repo.iter_user_messages(user_id):
+            ...     writer.writerow([msg.created_at, msg.message_body])
+        """
+        stmt = select(ChatMessage).where(
+            or_(
+                ChatMessage.sender_id == user_id,
+                ChatMessage.receiver_id == user_id
+            ),
+            ChatMessage.deleted_at.is_(None)
+        ).order_by(ChatMessage.created_at).execution_options(
+            yield_per=chunk_size
+        )
+        yield from self.db.scalars(stmt)
+    
     def get_unread_messages(self, user_id: str) -> List[ChatMessage]:
         """Get all unread messages for a user.
         
@@ -117,6 +343,42 @@ class ChatRepository(BaseRepository[ChatMessage]):
             ChatMessage.deleted_at.is_(None)
         ).order_by(ChatMessage.created_at).all()
     
+    def list_unread_previews(
+        self,
+        user_id: str,
+        preview_length: int = 80
+    ) -> List[Row]:
+        """Get lightweight previews of a user's unread messages.
+        
+        Selects only the columns needed for an unread badge/list and a
+        truncated body as Core rows, without building ChatMessage instances
+        or registering them in the session's identity map.
+        
+        Args:
+            user_id: The user's ID
+            preview_length: Maximum characters of the body to return
+        
+        Returns:
+            List of (id, sender_id, created_at, preview) rows ordered by
+            creation time; use ``row._asdict()`` for a dictionary
+        
+        Example:
+            >>> for item in repo.list_unread_previews(user_id):
+            ...     print(f"{item.sender_id}: {item.preview}")
+        """
+        stmt = select(
+            ChatMessage.id,
+            ChatMessage.sender_id,
+            ChatMessage.created_at,
+            func.substr(ChatMessage.message_body, 1, preview_length).label("preview")
+        ).where(
+            ChatMessage.receiver_id == user_id,
+            ChatMessage.is_read == False,
+            ChatMessage.deleted_at.is_(None)
+        ).order_by(ChatMessage.created_at)
+        
+        return list(self.db.execute(stmt).all())
+    
     def count_unread_messages(self, user_id: str) -> int:
         """Count unread messages for a user.
         
@@ -130,11 +392,9 @@ class ChatRepository(BaseRepository[ChatMessage]):
             >>> count = repo.count_unread_messages(user_id)
             >>> print(f"Unread: {count}")
         """
-        return self.db.query(ChatMessage).filter(
-            ChatMessage.receiver_id == user_id,
-            ChatMessage.is_read == False,
-            ChatMessage.deleted_at.is_(None)
-        ).count()
+        # Polled on every page load: read the denormalized counter on the
+        # user row instead of counting messages
+        return self.db.scalar(_UNREAD_COUNT_STMT, {"user_id": user_id}) or 0
     
     def mark_as_read(self, message_ids: List[str]) -> int:
         """Mark messages as read.
@@ -149,15 +409,20 @@ class ChatRepository(BaseRepository[ChatMessage]):
             >>> updated = repo.mark_as_read([msg1.id, msg2.id])
             >>> print(f"Marked {updated} messages as read")
         """
-        result = self.db.query(ChatMessage).filter(
-            ChatMessage.id.in_(message_ids),
+        stmt = update(ChatMessage).where(
+            self._id_in(message_ids),
+            ChatMessage.is_read == False,
             ChatMessage.deleted_at.is_(None)
-        ).update(
-            {"is_read": True},
-            synchronize_session=False
+        ).values(is_read=True).returning(ChatMessage.receiver_id)
+        receiver_ids = self.db.execute(
+            stmt.execution_options(synchronize_session=False)
+        ).scalars().all()
+        
+        self.user_repo.adjust_unread_counts(
+            "unread_chat_count",
+            {user_id: -n for user_id, n in Counter(receiver_ids).items()}
         )
-        self.db.flush()
-        return result
+        return len(receiver_ids)
     
     def mark_conversation_as_read(
         self,
@@ -179,14 +444,18 @@ class ChatRepository(BaseRepository[ChatMessage]):
             ...     sender_id=supervisor_id
             ... )
         """
-        result = self.db.query(ChatMessage).filter(
+        stmt = update(ChatMessage).where(
             ChatMessage.receiver_id == receiver_id,
             ChatMessage.sender_id == sender_id,
             ChatMessage.is_read == False,
             ChatMessage.deleted_at.is_(None)
-        ).update(
-            {"is_read": True},
-            synchronize_session=False
+        ).values(is_read=True)
+        updated = self.db.execute(
+            stmt.execution_options(synchronize_session=False)
+        ).rowcount
+        
+        self.user_repo.adjust_unread_counts(
+            "unread_chat_count",
+            {receiver_id: -updated}
         )
-        self.db.flush()
-        return result
+        return updated
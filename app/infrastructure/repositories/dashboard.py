@@ -0,0 +1,103 @@
+"""Dashboard repository for aggregated student summary queries.
+
+This module provides a read-only repository that gathers the figures shown
+on the student dashboard in a single database round-trip.
+
+Example:
+    >>> from app.infrastructure.repositories.dashboard import DashboardRepository
+    >>> 
+    >>> repo = DashboardRepository(db)
+    >>> summary = repo.fetch_dashboard(student_id)
+    >>> print(summary["pending_logs"], summary["unread_messages"])
+"""
+
+from typing import Any, Dict
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+
+from app.domain.models.user import User, StudentProfile
+from app.domain.models.placement import IndustrialPlacement
+from app.domain.models.log import DailyLog, LogStatus
+
+
+class DashboardRepository:
+    """Repository for dashboard summary queries.
+    
+    Unlike the model repositories this does not extend BaseRepository: it
+    spans several tables and only reads.
+    
+    Attributes:
+        db: The database session for queries
+    
+    Example:
+        >>> repo = DashboardRepository(db)
+        >>> summary = repo.fetch_dashboard(student_id)
+    """
+    
+    def __init__(self, db: Session):
+        """Initialize the dashboard repository.
+        
+        Args:
+            db: The database session for queries
+        """
+        self.db = db
+    
+    def fetch_dashboard(self, user_id: str) -> Dict[str, Any]:
+        """Get a student's active placement and badge counts in one query.
+        
+        Replaces separate calls to PlacementRepository.get_active_placement,
+        LogRepository.get_pending_logs and the unread counters.
+        
+        Args:
+            user_id: The student's user ID
+        
+        Returns:
+            Dictionary containing:
+                - placement: Active IndustrialPlacement, or None
+                - pending_logs: Logs awaiting review for that placement
+                - unread_messages: Unread chat messages
+                - unread_notifications: Unread notifications
+        
+        Example:
+            >>> summary = repo.fetch_dashboard(student_id)
+            >>> if summary["placement"]:
+            ...     print(summary["placement"].company_name)
+        """
+        pending_logs = select(func.count(DailyLog.id)).where(
+            DailyLog.student_id == User.id,
+            DailyLog.placement_id == StudentProfile.placement_id,
+            DailyLog.status == LogStatus.PENDING_REVIEW
+        ).scalar_subquery()
+        
+        stmt = select(
+            IndustrialPlacement,
+            pending_logs.label("pending_logs"),
+            User.unread_chat_count,
+            User.unread_notification_count
+        ).select_from(User).outerjoin(
+            StudentProfile,
+            StudentProfile.user_id == User.id
+        ).outerjoin(
+            IndustrialPlacement,
+            and_(
+                IndustrialPlacement.id == StudentProfile.placement_id,
+                IndustrialPlacement.deleted_at.is_(None)
+            )
+        ).where(User.id == user_id)
+        
+        row = self.db.execute(stmt).first()
+        if row is None:
+            return {
+                "placement": None,
+                "pending_logs": 0,
+                "unread_messages": 0,
+                "unread_notifications": 0
+            }
+        
+        placement, pending, unread_messages, unread_notifications = row
+        return {
+            "placement": placement,
+            "pending_logs": pending or 0,
+            "unread_messages": unread_messages,
+            "unread_notifications": unread_notifications
+        }
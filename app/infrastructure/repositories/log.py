@@ -11,13 +11,35 @@ Example:
     >>> pending = repo.get_pending_logs(placement_id)
 """
 
-from typing import Optional, List
+import math
+from typing import Optional, List, Set, Dict, Any, Iterator, Tuple
 from datetime import date, datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import Select, and_, or_, bindparam, case, func, insert, select
 
 from app.infrastructure.repositories.base import BaseRepository
 from app.domain.models.log import DailyLog, LogStatus, LocationStatus
+from app.domain.models.placement import Geofence, IndustrialPlacement
+
+# Mean Earth radius in meters, matching the geofence service
+_EARTH_RADIUS_METERS = 6371000.0
+
+# Logs with usable coordinates: GPS fields set and not the (0, 0) placeholder
+_HAS_LOCATION = and_(
+    DailyLog.latitude.is_not(None),
+    DailyLog.longitude.is_not(None),
+    or_(DailyLog.latitude != 0, DailyLog.longitude != 0)
+)
+
+# Hot-path statements built once at import; callers bind parameters per call
+_LOG_BY_DATE_STMT = select(DailyLog).where(
+    DailyLog.student_id == bindparam("student_id"),
+    DailyLog.log_date == bindparam("log_date")
+).limit(1)
+
+_LOG_BY_CLIENT_UUID_STMT = select(DailyLog).where(
+    DailyLog.client_uuid == bindparam("client_uuid")
+).limit(1)
 
 
 class LogRepository(BaseRepository[DailyLog]):
@@ -39,6 +61,29 @@ class LogRepository(BaseRepository[DailyLog]):
         """
         super().__init__(DailyLog, db)
     
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Insert a batch of logs in a single executemany INSERT.
+        
+        Intended for offline sync, where many logs arrive in one request.
+        No ORM instances are built; the generated server IDs are returned
+        so the caller can acknowledge each client log.
+        
+        Args:
+            rows: List of DailyLog field dictionaries, each with a client_uuid
+        
+        Returns:
+            Dictionary mapping each client_uuid to its server-generated ID
+        
+        Example:
+            >>> acks = repo.bulk_create([log_data_1, log_data_2])
+            >>> server_id = acks[log_data_1["client_uuid"]]
+        """
+        if not rows:
+            return {}
+        
+        stmt = insert(DailyLog).returning(DailyLog.client_uuid, DailyLog.id)
+        return dict(self.db.execute(stmt, rows).all())
+    
     def get_student_logs(
         self,
         student_id: str,
@@ -58,19 +103,61 @@ class LogRepository(BaseRepository[DailyLog]):
         Example:
             >>> logs = repo.get_student_logs(student_id, limit=20)
         """
-        query = self.db.query(DailyLog).filter(
-            DailyLog.student_id == student_id
+        stmt = self._student_logs_stmt(student_id, placement_id)
+        
+        if limit:
+            stmt = stmt.limit(limit)
+        
+        return list(self.db.scalars(stmt).all())
+    
+    def iter_student_logs(
+        self,
+        student_id: str,
+        placement_id: Optional[str] = None,
+        chunk_size: int = 500
+    ) -> Iterator[DailyLog]:
+        """Stream all logs for a student.
+        
+        Intended for full-history exports: rows are fetched in chunks of
+        ``chunk_size`` so memory stays bounded for long placements.
+        
+        Args:
+            student_id: The student's user ID
+            placement_id: Optional placement ID to filter by
+            chunk_size: Number of rows fetched per round-trip (default: 500)
+        
+        Yields:
+            DailyLog instances ordered by date descending
+        
+        Example:
+            >>> for log in repo.iter_student_logs(student_id, placement_id):
+            ...     writer.writerow([log.log_date, log.activity_description])
+        """
+        stmt = self._student_logs_stmt(student_id, placement_id)
+        yield from self.db.scalars(
+            stmt.execution_options(yield_per=chunk_size)
         )
+    
+    def _student_logs_stmt(
+        self,
+        student_id: str,
+        placement_id: Optional[str] = None
+    ) -> Select:
+        """Build the SELECT shared by get_student_logs and iter_student_logs.
         
-        if placement_id:
-            query = query.filter(DailyLog.placement_id == placement_id)
+        Args:
+            student_id: The student's user ID
+            placement_id: Optional placement ID to filter by
         
-        query = query.order_by(DailyLog.log_date.desc())
+        Returns:
+            SELECT of the student's logs ordered by date descending
+        """
+        stmt = select(DailyLog).where(DailyLog.student_id == student_id)
         
-        if limit:
-            query = query.limit(limit)
+        if placement_id:
+            stmt = stmt.where(DailyLog.placement_id == placement_id)
         
-        return query.all()
+        return stmt.order_by(DailyLog.log_date.desc())
     
     def get_logs_by_week(
         self,
@@ -157,9 +244,9 @@ class LogRepository(BaseRepository[DailyLog]):
         Example:
             >>> today_log = repo.get_log_by_date(student_id, date.today())
         """
-        return self.db.query(DailyLog).filter(
-            DailyLog.student_id == student_id,
-            DailyLog.log_date == log_date
+        return self.db.scalars(
+            _LOG_BY_DATE_STMT,
+            {"student_id": student_id, "log_date": log_date}
         ).first()
     
     def get_unsynced_logs(self, student_id: str) -> List[DailyLog]:
@@ -196,10 +283,37 @@ class LogRepository(BaseRepository[DailyLog]):
             >>> if log:
             ...     print("Log already synced")
         """
-        return self.db.query(DailyLog).filter(
-            DailyLog.client_uuid == client_uuid
+        return self.db.scalars(
+            _LOG_BY_CLIENT_UUID_STMT,
+            {"client_uuid": client_uuid}
         ).first()
     
+    def exists_by_client_uuids(self, client_uuids: List[str]) -> Set[str]:
+        """Find which client UUIDs have already been synced.
+        
+        Args:
+            client_uuids: Client-generated UUIDs from an offline batch
+        
+        Returns:
+            Set of the given UUIDs that already exist on the server
+        
+        Example:
+            >>> existing = repo.exists_by_client_uuids(["uuid-1", "uuid-2"])
+            >>> if "uuid-1" in existing:
+            ...     print("Log already synced")
+        
+        Note:
+            Resolved with one ``WHERE client_uuid IN (...)`` lookup on the
+            unique client_uuid index, instead of one query per log.
+        """
+        if not client_uuids:
+            return set()
+        
+        rows = self.db.query(DailyLog.client_uuid).filter(
+            DailyLog.client_uuid.in_(client_uuids)
+        ).all()
+        return {row[0] for row in rows}
+    
     def get_logs_by_location_status(
         self,
         placement_id: str,
@@ -225,6 +339,80 @@ class LogRepository(BaseRepository[DailyLog]):
             DailyLog.location_status == location_status
         ).order_by(DailyLog.log_date.desc()).all()
     
+    def get_logs_outside_geofence(self, placement_id: str) -> List[DailyLog]:
+        """Get a placement's logs whose coordinates fall outside its geofence.
+        
+        The placement's geofence is joined in and the containment test runs
+        in the database, so every log is checked by one query instead of
+        being loaded and measured one by one in Python.
+        
+        Args:
+            placement_id: The placement ID
+        
+        Returns:
+            List of DailyLog instances outside the geofence, newest first.
+            Logs without coordinates, or at (0, 0), are not included.
+        
+        Example:
+            >>> outside_logs = repo.get_logs_outside_geofence(placement_id)
+            >>> print(f"{len(outside_logs)} logs outside the work site")
+        
+        Note:
+            Distance uses the flat-earth (equirectangular) approximation, so
+            the predicate needs only ``cos``/``radians`` and arithmetic and
+            runs unchanged on SQLite and PostgreSQL. GeofenceService uses the
+            same formula, so both agree on which logs are outside.
+        """
+        meters_per_degree = math.radians(_EARTH_RADIUS_METERS)
+        dy = (DailyLog.latitude - Geofence.latitude) * meters_per_degree
+        dx = (DailyLog.longitude - Geofence.longitude) * meters_per_degree * func.cos(
+            func.radians(Geofence.latitude)
+        )
+        
+        # Soft-deleted placements and geofences have no boundary to check
+        return self.db.query(DailyLog).join(
+            IndustrialPlacement,
+            and_(
+                IndustrialPlacement.id == DailyLog.placement_id,
+                IndustrialPlacement.deleted_at.is_(None)
+            )
+        ).join(
+            Geofence,
+            and_(
+                Geofence.id == IndustrialPlacement.geofence_id,
+                Geofence.deleted_at.is_(None)
+            )
+        ).filter(
+            DailyLog.placement_id == placement_id,
+            _HAS_LOCATION,
+            dx * dx + dy * dy > Geofence.radius_meters * Geofence.radius_meters
+        ).order_by(DailyLog.log_date.desc()).all()
+    
+    def count_located_logs(self, placement_id: str) -> Tuple[int, int]:
+        """Count a placement's logs, and how many have usable coordinates.
+        
+        Logs without coordinates, or at (0, 0), cannot be checked against
+        the geofence; get_logs_outside_geofence() skips them too.
+        
+        Args:
+            placement_id: The placement ID
+        
+        Returns:
+            Tuple of (total_logs, located_logs)
+        
+        Example:
+            >>> total, located = repo.count_located_logs(placement_id)
+            >>> print(f"{total - located} logs have no location")
+        """
+        total, located = self.db.query(
+            func.count(DailyLog.id),
+            func.count(case((_HAS_LOCATION, DailyLog.id)))
+        ).filter(
+            DailyLog.placement_id == placement_id
+        ).one()
+        
+        return total, located
+    
     def count_logs_by_week(self, placement_id: str) -> dict:
         """Count logs for each week in a placement.
         
@@ -238,15 +426,11 @@ class LogRepository(BaseRepository[DailyLog]):
             >>> counts = repo.count_logs_by_week(placement_id)
             >>> print(f"Week 1: {counts.get(1, 0)} logs")
         """
-        logs = self.db.query(
+        rows = self.db.query(
             DailyLog.week_number,
-            DailyLog.id
+            func.count(DailyLog.id)
         ).filter(
             DailyLog.placement_id == placement_id
-        ).all()
-        
-        counts = {}
-        for week_number, _ in logs:
-            counts[week_number] = counts.get(week_number, 0) + 1
+        ).group_by(DailyLog.week_number).all()
         
-        return counts
+        return dict(rows)
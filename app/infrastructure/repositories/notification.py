@@ -11,11 +11,22 @@ Example:
     >>> repo.mark_all_as_read(user_id)
 """
 
-from typing import List, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, func, select, update
 
 from app.infrastructure.repositories.base import BaseRepository
+from app.infrastructure.repositories.user import UserRepository
 from app.domain.models.chat import Notification, NotificationType
+from app.domain.models.user import User
+
+# Hot-path statements built once at import; callers bind parameters per call
+_UNREAD_COUNT_STMT = select(User.unread_notification_count).where(
+    User.id == bindparam("user_id")
+)
 
 
 class NotificationRepository(BaseRepository[Notification]):
@@ -36,6 +47,81 @@ class NotificationRepository(BaseRepository[Notification]):
             db: The database session for queries
         """
         super().__init__(Notification, db)
+        self.user_repo = UserRepository(db)
+    
+    def create(self, data: Dict[str, Any]) -> Notification:
+        """Create a notification and bump the user's unread counter.
+        
+        Args:
+            data: Dictionary of Notification field values
+        
+        Returns:
+            The created Notification instance
+        
+        Example:
+            >>> notification = repo.create({
+            ...     "user_id": student_id,
+            ...     "type": NotificationType.LOG_VERIFIED,
+            ...     "title": "Log Verified",
+            ...     "message": "Your log for Week 1 has been verified"
+            ... })
+        """
+        notification = super().create(data)
+        self._count_new_unread([notification])
+        return notification
+    
+    def create_many(self, data: List[Dict[str, Any]]) -> List[Notification]:
+        """Create several notifications and bump the unread counters.
+        
+        Args:
+            data: List of Notification field dictionaries
+        
+        Returns:
+            The created Notification instances, in the same order as ``data``
+        """
+        notifications = super().create_many(data)
+        self._count_new_unread(notifications)
+        return notifications
+    
+    def _count_new_unread(self, notifications: List[Notification]) -> None:
+        """Add newly created unread notifications to their users' counters.
+        
+        Args:
+            notifications: Freshly inserted Notification instances
+        """
+        self.user_repo.adjust_unread_counts(
+            "unread_notification_count",
+            Counter(n.user_id for n in notifications if not n.is_read)
+        )
+    
+    def delete(self, id: str | UUID, soft: bool = True) -> bool:
+        """Delete a notification and drop it from the unread counter if unread.
+        
+        Args:
+            id: The notification's unique identifier
+            soft: Whether to soft delete (default) or hard delete
+        
+        Returns:
+            True if deleted, False if not found (or already soft-deleted)
+        
+        Example:
+            >>> repo.delete(notification_id)
+        """
+        notification = self.get_by_id(id)
+        if notification is None:
+            return False
+        
+        # Read before deleting: the instance is expired or removed afterwards
+        user_id, is_read = notification.user_id, notification.is_read
+        if not super().delete(notification.id, soft):
+            return False
+        
+        if not is_read:
+            self.user_repo.adjust_unread_counts(
+                "unread_notification_count",
+                {user_id: -1}
+            )
+        return True
     
     def get_user_notifications(
         self,
@@ -71,6 +157,44 @@ class NotificationRepository(BaseRepository[Notification]):
             Notification.created_at.desc()
         ).limit(limit).all()
     
+    def list_unread_notifications_raw(
+        self,
+        user_id: str,
+        limit: int = 50
+    ) -> List[Row]:
+        """Get a user's unread notifications as lightweight Core rows.
+        
+        For read-only list endpoints that serialize straight to JSON: only
+        the listed columns are selected and no Notification instances are
+        built or tracked by the session.
+        
+        Args:
+            user_id: The user's ID
+            limit: Maximum number of notifications to return
+        
+        Returns:
+            List of (id, type, title, action_url, created_at) rows ordered
+            by creation time descending; use ``row._asdict()`` for a
+            dictionary
+        
+        Example:
+            >>> for row in repo.list_unread_notifications_raw(user_id):
+            ...     print(f"{row.type.value}: {row.title}")
+        """
+        stmt = select(
+            Notification.id,
+            Notification.type,
+            Notification.title,
+            Notification.action_url,
+            Notification.created_at
+        ).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False,
+            Notification.deleted_at.is_(None)
+        ).order_by(Notification.created_at.desc()).limit(limit)
+        
+        return list(self.db.execute(stmt).all())
+    
     def get_by_type(
         self,
         user_id: str,
@@ -112,11 +236,9 @@ class NotificationRepository(BaseRepository[Notification]):
             >>> count = repo.count_unread(user_id)
             >>> print(f"You have {count} unread notifications")
         """
-        return self.db.query(Notification).filter(
-            Notification.user_id == user_id,
-            Notification.is_read == False,
-            Notification.deleted_at.is_(None)
-        ).count()
+        # Polled on every page load: read the denormalized counter on the
+        # user row instead of counting notifications
+        return self.db.scalar(_UNREAD_COUNT_STMT, {"user_id": user_id}) or 0
     
     def mark_as_read(self, notification_ids: List[str]) -> int:
         """Mark notifications as read.
@@ -130,15 +252,20 @@ class NotificationRepository(BaseRepository[Notification]):
         Example:
             >>> updated = repo.mark_as_read([notif1.id, notif2.id])
         """
-        result = self.db.query(Notification).filter(
-            Notification.id.in_(notification_ids),
+        stmt = update(Notification).where(
+            self._id_in(notification_ids),
+            Notification.is_read == False,
             Notification.deleted_at.is_(None)
-        ).update(
-            {"is_read": True},
-            synchronize_session=False
+        ).values(is_read=True).returning(Notification.user_id)
+        user_ids = self.db.execute(
+            stmt.execution_options(synchronize_session=False)
+        ).scalars().all()
+        
+        self.user_repo.adjust_unread_counts(
+            "unread_notification_count",
+            {user_id: -n for user_id, n in Counter(user_ids).items()}
         )
-        self.db.flush()
-        return result
+        return len(user_ids)
     
     def mark_all_as_read(self, user_id: str) -> int:
         """Mark all notifications as read for a user.
@@ -153,16 +280,20 @@ class NotificationRepository(BaseRepository[Notification]):
             >>> updated = repo.mark_all_as_read(user_id)
             >>> print(f"Marked {updated} notifications as read")
         """
-        result = self.db.query(Notification).filter(
+        stmt = update(Notification).where(
             Notification.user_id == user_id,
             Notification.is_read == False,
             Notification.deleted_at.is_(None)
-        ).update(
-            {"is_read": True},
-            synchronize_session=False
+        ).values(is_read=True)
+        updated = self.db.execute(
+            stmt.execution_options(synchronize_session=False)
+        ).rowcount
+        
+        self.user_repo.adjust_unread_counts(
+            "unread_notification_count",
+            {user_id: -updated}
         )
-        self.db.flush()
-        return result
+        return updated
     
     def delete_old_notifications(
         self,
@@ -171,6 +302,9 @@ class NotificationRepository(BaseRepository[Notification]):
     ) -> int:
         """Soft delete notifications older than specified days.
         
+        Unread notifications among them are taken off the user's unread
+        counter.
+        
         Args:
             user_id: The user's ID
             days: Number of days to keep (default: 30)
@@ -182,20 +316,23 @@ class NotificationRepository(BaseRepository[Notification]):
             >>> deleted = repo.delete_old_notifications(user_id, days=60)
             >>> print(f"Deleted {deleted} old notifications")
         """
-        from datetime import datetime, timedelta
-        
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
-        notifications = self.db.query(Notification).filter(
+        stmt = update(Notification).where(
             Notification.user_id == user_id,
             Notification.created_at < cutoff_date,
             Notification.deleted_at.is_(None)
-        ).all()
-        
-        count = 0
-        for notification in notifications:
-            notification.soft_delete()
-            count += 1
+        ).values(
+            is_deleted=True,
+            deleted_at=func.now()
+        ).returning(Notification.is_read)
+        was_read = self.db.execute(
+            stmt.execution_options(synchronize_session=False)
+        ).scalars().all()
         
-        self.db.flush()
-        return count
+        # Deleted unread notifications no longer count as unread
+        self.user_repo.adjust_unread_counts(
+            "unread_notification_count",
+            {user_id: -was_read.count(False)}
+        )
+        return len(was_read)
@@ -11,11 +11,21 @@ Example:
 """
 
 from typing import Optional, List
-from datetime import date
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.infrastructure.repositories.base import BaseRepository
 from app.domain.models.placement import IndustrialPlacement, Geofence
+from app.domain.models.user import StudentProfile
+
+# Hot-path statements built once at import; callers bind parameters per call
+_ACTIVE_PLACEMENT_STMT = select(IndustrialPlacement).join(
+    StudentProfile,
+    StudentProfile.placement_id == IndustrialPlacement.id
+).where(
+    StudentProfile.user_id == bindparam("student_id"),
+    IndustrialPlacement.deleted_at.is_(None)
+).limit(1)
 
 
 class PlacementRepository(BaseRepository[IndustrialPlacement]):
@@ -51,22 +61,13 @@ class PlacementRepository(BaseRepository[IndustrialPlacement]):
             >>> if placement:
             ...     print(f"Placed at: {placement.company_name}")
         """
-        from app.domain.models.user import StudentProfile
-        
-        # Query through StudentProfile since it has the placement_id foreign key
-        student_profile = self.db.query(StudentProfile).filter(
-            StudentProfile.user_id == student_id
-        ).first()
-        
-        if not student_profile or not student_profile.placement_id:
-            return None
-        
-        # Get the placement (no date/status checks since model doesn't have those fields)
-        placement = self.db.query(IndustrialPlacement).filter(
-            IndustrialPlacement.id == student_profile.placement_id
+        # Join through StudentProfile since it has the placement_id foreign key
+        # (no date/status checks since model doesn't have those fields).
+        # Hit on most student requests, so it uses a prebuilt statement.
+        return self.db.scalars(
+            _ACTIVE_PLACEMENT_STMT,
+            {"student_id": student_id}
         ).first()
-        
-        return placement
     
     def get_student_placements(
         self,
@@ -85,21 +86,26 @@ class PlacementRepository(BaseRepository[IndustrialPlacement]):
         Example:
             >>> placements = repo.get_student_placements(student_id)
             >>> for p in placements:
-            ...     print(f"{p.company_name}: {p.start_date} - {p.end_date}")
+            ...     print(p.company_name)
         """
-        query = self.db.query(IndustrialPlacement).filter(
-            IndustrialPlacement.student_id == student_id,
+        # Placements and SIWES dates are linked through StudentProfile
+        query = self.db.query(IndustrialPlacement).join(
+            StudentProfile,
+            StudentProfile.placement_id == IndustrialPlacement.id
+        ).filter(
+            StudentProfile.user_id == student_id,
             IndustrialPlacement.deleted_at.is_(None)
         )
         
         if not include_inactive:
-            today = date.today()
+            # Compare against CURRENT_DATE in SQL so the statement text and
+            # parameters are identical on every call
             query = query.filter(
-                IndustrialPlacement.start_date <= today,
-                IndustrialPlacement.end_date >= today
+                StudentProfile.siwes_start_date <= func.current_date(),
+                StudentProfile.siwes_end_date >= func.current_date()
             )
         
-        return query.order_by(IndustrialPlacement.start_date.desc()).all()
+        return query.order_by(StudentProfile.siwes_start_date.desc()).all()
     
     def get_placement_with_geofence(
         self,
@@ -117,9 +123,16 @@ class PlacementRepository(BaseRepository[IndustrialPlacement]):
             >>> placement = repo.get_placement_with_geofence(placement_id)
             >>> if placement.geofence:
             ...     print(f"Radius: {placement.geofence.radius_meters}m")
+        
+        Note:
+            Other relationships (e.g. ``students``) are not loaded and raise
+            on access; fetch them explicitly instead of lazy loading.
         """
+        # The geofence is 1-to-1, so a JOIN adds no duplicate rows. Any other
+        # relationship access raises instead of silently lazy loading.
         return self.db.query(IndustrialPlacement).options(
-            joinedload(IndustrialPlacement.geofence)
+            joinedload(IndustrialPlacement.geofence),
+            raiseload('*')
         ).filter(
             IndustrialPlacement.id == placement_id,
             IndustrialPlacement.deleted_at.is_(None)
@@ -137,7 +150,7 @@ class PlacementRepository(BaseRepository[IndustrialPlacement]):
         Example:
             >>> geofence = repo.get_placement_geofence(placement_id)
             >>> if geofence:
-            ...     print(f"Center: {geofence.center_latitude}, {geofence.center_longitude}")
+            ...     print(f"Center: {geofence.latitude}, {geofence.longitude}")
         """
         return self.db.query(Geofence).filter(
             Geofence.placement_id == placement_id,
@@ -161,28 +174,20 @@ class PlacementRepository(BaseRepository[IndustrialPlacement]):
         Example:
             >>> placement = repo.create_placement_with_geofence(
             ...     placement_data={
-            ...         "student_id": student_id,
             ...         "company_name": "Tech Corp",
-            ...         "company_address": "123 Tech Street",
-            ...         "start_date": date(2024, 1, 1),
-            ...         "end_date": date(2024, 6, 30)
+            ...         "address": "123 Tech Street"
             ...     },
             ...     geofence_data={
-            ...         "center_latitude": 6.5244,
-            ...         "center_longitude": 3.3792,
+            ...         "latitude": 6.5244,
+            ...         "longitude": 3.3792,
             ...         "radius_meters": 500
             ...     }
             ... )
         """
-        # Create placement
-        placement = self.create(placement_data)
-        
-        # Create geofence
-        geofence_data['placement_id'] = placement.id
-        geofence = Geofence(**geofence_data)
-        self.db.add(geofence)
+        # Link through the relationship so a single flush inserts the
+        # geofence first and wires placement.geofence_id automatically
+        placement = IndustrialPlacement(**placement_data)
+        placement.geofence = Geofence(**geofence_data)
+        self.db.add(placement)
         self.db.flush()
-        
-        # Refresh to load relationship
-        self.db.refresh(placement)
         return placement
@@ -11,11 +11,15 @@ Example:
     >>> student_profile = repo.get_student_profile(user.id)
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+import uuid
+from typing import Callable, Optional, List, Dict, Tuple
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy import case, func, insert, select, update
 
 from app.infrastructure.repositories.base import BaseRepository
 from app.domain.models.user import User, StudentProfile, SupervisorProfile, UserRole
+from app.domain.models.chat import ChatMessage, Notification
 
 
 class UserRepository(BaseRepository[User]):
@@ -93,9 +97,8 @@ class UserRepository(BaseRepository[User]):
             >>> profile = repo.get_student_profile(user.id)
             >>> print(profile.matric_number)
         """
-        return self.db.query(StudentProfile).filter(
-            StudentProfile.user_id == user_id
-        ).first()
+        # user_id is the primary key: check the identity map before querying
+        return self.db.get(StudentProfile, str(user_id))
     
     def get_supervisor_profile(self, user_id: str) -> Optional[SupervisorProfile]:
         """Get a supervisor's profile.
@@ -110,31 +113,128 @@ class UserRepository(BaseRepository[User]):
             >>> profile = repo.get_supervisor_profile(user.id)
             >>> print(profile.department)
         """
-        return self.db.query(SupervisorProfile).filter(
-            SupervisorProfile.user_id == user_id
-        ).first()
+        # user_id is the primary key: check the identity map before querying
+        return self.db.get(SupervisorProfile, str(user_id))
     
-    def get_user_with_profile(self, user_id: str) -> Optional[User]:
+    def get_user_with_profile(
+        self,
+        user_id: str,
+        role: Optional[UserRole] = None
+    ) -> Optional[User]:
         """Get a user with their profile eagerly loaded.
         
         Args:
             user_id: The user's unique identifier
+            role: The user's role, if already known (e.g. from the session).
+                Only the matching profile is joined.
         
         Returns:
             The User instance with profile loaded, or None if not found
         
         Example:
-            >>> user = repo.get_user_with_profile(user_id)
-            >>> if user.role == UserRole.STUDENT:
-            ...     print(user.student_profile.matric_number)
+            >>> user = repo.get_user_with_profile(user_id, UserRole.STUDENT)
+            >>> print(user.student_profile.matriculation_number)
+        
+        Note:
+            Without a role both profiles are outer-joined in the same query;
+            that is still cheaper than probing the role in a separate
+            round-trip first.
         """
         return self.db.query(User).options(
-            # joinedload(User.student_profile),
-            # joinedload(User.supervisor_profile)
+            *self._profile_loaders(role)
         ).filter(
             User.id == user_id
         ).first()
     
+    def get_users_with_profiles(
+        self,
+        role: UserRole,
+        limit: Optional[int] = None
+    ) -> List[User]:
+        """Get users of a role with their profiles eagerly loaded.
+        
+        Args:
+            role: The user role to filter by
+            limit: Maximum number of users to return
+        
+        Returns:
+            List of User instances with profiles loaded
+        
+        Example:
+            >>> students = repo.get_users_with_profiles(UserRole.STUDENT)
+            >>> for user in students:
+            ...     print(user.student_profile.matriculation_number)
+        
+        Note:
+            Profiles are fetched with selectinload: one query for the users
+            and one ``WHERE user_id IN (...)`` query for their profiles,
+            keeping the user rows narrow. Single-row lookups keep joinedload.
+        """
+        query = self.db.query(User).options(
+            *self._profile_loaders(role, selectinload)
+        ).filter(
+            User.role == role
+        )
+        
+        if limit:
+            query = query.limit(limit)
+        
+        return query.all()
+    
+    def _create_with_profile(
+        self,
+        user_data: dict,
+        profile_model: type,
+        profile_attr: str,
+        profile_data: dict
+    ) -> User:
+        """Insert a user and its profile in a single flush.
+        
+        The profile is attached through the User relationship, so the unit
+        of work inserts both rows (user first) and fills in the profile's
+        user_id. The profile stays loaded on the returned user, so no
+        refresh or lazy load follows.
+        
+        Args:
+            user_data: Dictionary of user fields
+            profile_model: StudentProfile or SupervisorProfile
+            profile_attr: Name of the matching relationship on User
+            profile_data: Dictionary of profile fields
+        
+        Returns:
+            The created User instance with its profile attached
+        """
+        user = User(**user_data)
+        setattr(user, profile_attr, profile_model(**profile_data))
+        self.db.add(user)
+        self.db.flush()
+        self._refresh_expired(user)
+        return user
+    
+    @staticmethod
+    def _profile_loaders(
+        role: Optional[UserRole],
+        loader: Callable = joinedload
+    ) -> tuple:
+        """Get the eager-load options for the profile matching a role.
+        
+        Args:
+            role: The user role, or None if unknown
+            loader: Loader strategy; joinedload for single rows,
+                selectinload for lists
+        
+        Returns:
+            Tuple of loader options to pass to ``Query.options()``
+        """
+        if role is UserRole.STUDENT:
+            return (loader(User.student_profile),)
+        if role is UserRole.SUPERVISOR:
+            return (loader(User.supervisor_profile),)
+        return (
+            loader(User.student_profile),
+            loader(User.supervisor_profile)
+        )
+    
     def create_student(
         self,
         user_data: dict,
@@ -164,18 +264,56 @@ class UserRepository(BaseRepository[User]):
             ...     }
             ... )
         """
-        # Create user
-        user = self.create(user_data)
+        return self._create_with_profile(
+            user_data,
+            StudentProfile,
+            "student_profile",
+            profile_data
+        )
+    
+    def bulk_create_students(
+        self,
+        records: List[Tuple[dict, dict]]
+    ) -> List[str]:
+        """Create many student users with profiles in two batched INSERTs.
         
-        # Create student profile
-        profile_data['user_id'] = user.id
-        profile = StudentProfile(**profile_data)
-        self.db.add(profile)
-        self.db.flush()
+        IDs are generated client-side so the profile rows can reference
+        their users without RETURNING; each table is then written with a
+        single executemany, however large the batch.
         
-        # Refresh to load relationship
-        self.db.refresh(user)
-        return user
+        Args:
+            records: List of (user_data, profile_data) pairs, as accepted
+                by create_student()
+        
+        Returns:
+            The new user IDs, in the same order as ``records``
+        
+        Example:
+            >>> user_ids = repo.bulk_create_students([
+            ...     ({"email": "ada@university.edu", "full_name": "Ada",
+            ...       "password_hash": hashed_password},
+            ...      {"matriculation_number": "CSC/2020/001"}),
+            ... ])
+        
+        Note:
+            Rows are inserted with Core statements, so no User instances
+            are added to the session.
+        """
+        if not records:
+            return []
+        
+        user_rows = [
+            {"role": UserRole.STUDENT, **user_data, "id": str(uuid.uuid4())}
+            for user_data, _ in records
+        ]
+        profile_rows = [
+            {**profile_data, "user_id": user_row["id"]}
+            for user_row, (_, profile_data) in zip(user_rows, records)
+        ]
+        
+        self.db.execute(insert(User), user_rows)
+        self.db.execute(insert(StudentProfile), profile_rows)
+        return [user_row["id"] for user_row in user_rows]
     
     def create_supervisor(
         self,
@@ -205,15 +343,83 @@ class UserRepository(BaseRepository[User]):
             ...     }
             ... )
         """
-        # Create user
-        user = self.create(user_data)
+        return self._create_with_profile(
+            user_data,
+            SupervisorProfile,
+            "supervisor_profile",
+            profile_data
+        )
+    
+    def adjust_unread_counts(
+        self,
+        counter: str,
+        deltas: Dict[str, int]
+    ) -> None:
+        """Apply changes to a denormalized unread counter on users.
         
-        # Create supervisor profile
-        profile_data['user_id'] = user.id
-        profile = SupervisorProfile(**profile_data)
-        self.db.add(profile)
-        self.db.flush()
+        Args:
+            counter: Name of the counter column, either "unread_chat_count"
+                or "unread_notification_count"
+            deltas: Mapping of user ID to the amount to add (negative to
+                subtract). Results are clamped at zero.
         
-        # Refresh to load relationship
-        self.db.refresh(user)
-        return user
+        Example:
+            >>> repo.adjust_unread_counts("unread_chat_count", {receiver_id: 1})
+        
+        Note:
+            Issues one UPDATE per user without loading the row. The counter
+            is expired on any User already in the session so its next read
+            reflects the new value.
+        """
+        column = getattr(User, counter)
+        
+        for user_id, delta in deltas.items():
+            if not delta:
+                continue
+            
+            new_value = column + delta
+            stmt = update(User).where(User.id == str(user_id)).values({
+                counter: case((new_value < 0, 0), else_=new_value)
+            })
+            self.db.execute(stmt.execution_options(synchronize_session=False))
+            
+            user = self.db.identity_map.get(identity_key(User, str(user_id)))
+            if user is not None:
+                self.db.expire(user, [counter])
+    
+    def reconcile_unread_counts(self) -> int:
+        """Recompute every user's unread counters from the source tables.
+        
+        Corrects drift in the denormalized counters, e.g. from soft-deleted
+        unread rows or writes that bypassed the repositories. Intended to
+        run as a periodic maintenance job and as the backfill after adding
+        the columns.
+        
+        Returns:
+            Number of user rows updated
+        
+        Example:
+            >>> updated = repo.reconcile_unread_counts()
+            >>> db.commit()
+        """
+        unread_chat = select(func.count(ChatMessage.id)).where(
+            ChatMessage.receiver_id == User.id,
+            ChatMessage.is_read == False,
+            ChatMessage.deleted_at.is_(None)
+        ).scalar_subquery()
+        
+        unread_notifications = select(func.count(Notification.id)).where(
+            Notification.user_id == User.id,
+            Notification.is_read == False,
+            Notification.deleted_at.is_(None)
+        ).scalar_subquery()
+        
+        stmt = update(User).values(
+            unread_chat_count=unread_chat,
+            unread_notification_count=unread_notifications
+        )
+        result = self.db.execute(
+            stmt.execution_options(synchronize_session=False)
+        )
+        self.db.expire_all()
+        return result.rowcount
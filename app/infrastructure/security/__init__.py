@@ -8,10 +8,17 @@ Modules:
     session: Session management and user authentication
 """
 
-from app.infrastructure.security.password import hash_password, verify_password
+from app.infrastructure.security.password import (
+    hash_password,
+    verify_password,
+    ahash_password,
+    averify_password,
+)
 from app.infrastructure.security.session import (
+    UserView,
     create_session,
     get_current_user,
+    auth,
     require_auth,
     require_role,
 )
@@ -19,8 +26,12 @@ from app.infrastructure.security.session import (
 __all__ = [
     "hash_password",
     "verify_password",
+    "ahash_password",
+    "averify_password",
+    "UserView",
     "create_session",
     "get_current_user",
+    "auth",
     "require_auth",
     "require_role",
 ]
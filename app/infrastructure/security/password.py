@@ -14,9 +14,34 @@ Example:
     >>> assert is_valid is True
 """
 
+import asyncio
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
 import bcrypt
 from typing import Optional
 
+# Anchored match on the "$2b$12$" prefix of a bcrypt hash; captures the cost
+_BCRYPT_COST_RE = re.compile(r"\$2[aby]\$(\d{2})\$")
+
+# Every bcrypt hash is 60 ASCII characters starting with one of these
+_BCRYPT_HASH_LENGTH = 60
+_BCRYPT_PREFIXES = (b"$2a$", b"$2b$", b"$2y$")
+
+# Recently verified (password, hash) pairs, keyed by a keyed digest so no
+# plaintext is retained. Only successful checks are cached: failed attempts
+# always pay the full bcrypt cost.
+_VERIFY_CACHE_SIZE = 256
+_VERIFY_CACHE_TTL_SECONDS = 60.0
+_verify_cache_key = os.urandom(32)
+_verify_cache: "OrderedDict[bytes, float]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
 
 def hash_password(password: str, rounds: int = 12) -> str:
     """Hash a password using bcrypt.
@@ -81,21 +106,124 @@ def verify_password(password: str, hashed_password: str) -> bool:
         False
     
     Note:
-        - Returns False for any errors (invalid hash format, etc.)
+        - Returns False for any errors (invalid hash format, etc.); hashes
+          that are not 60 characters with a $2a$/$2b$/$2y$ prefix are
+          rejected without calling bcrypt
         - Uses constant-time comparison to prevent timing attacks
         - Compatible with hashes from any bcrypt implementation
+        - Successful checks are remembered for 60 seconds, so repeated
+          verifies of the same credentials skip the bcrypt work
     """
     if not password or not hashed_password:
         return False
     
     try:
-        return bcrypt.checkpw(
-            password.encode('utf-8'),
-            hashed_password.encode('utf-8')
-        )
-    except (ValueError, AttributeError):
-        # Invalid hash format or encoding issues
+        password_bytes = password.encode('utf-8')
+        hash_bytes = hashed_password.encode('utf-8')
+    except AttributeError:
+        # Encoding issues
+        return False
+    
+    # Reject anything that cannot be a bcrypt hash before hashing anything
+    if (
+        len(hash_bytes) != _BCRYPT_HASH_LENGTH
+        or not hash_bytes.startswith(_BCRYPT_PREFIXES)
+    ):
+        return False
+    
+    cache_key = hmac.new(
+        _verify_cache_key,
+        password_bytes + b"\0" + hash_bytes,
+        hashlib.sha256
+    ).digest()
+    if _recently_verified(cache_key):
+        return True
+    
+    try:
+        is_valid = bcrypt.checkpw(password_bytes, hash_bytes)
+    except ValueError:
+        # Invalid hash format
         return False
+    
+    if is_valid:
+        _remember_verified(cache_key)
+    return is_valid
+
+
+def _recently_verified(cache_key: bytes) -> bool:
+    """Check whether a password/hash pair was verified within the TTL.
+    
+    Args:
+        cache_key: Keyed digest of the password and hash
+    
+    Returns:
+        True if the pair is cached and not yet expired
+    """
+    now = time.monotonic()
+    with _verify_cache_lock:
+        verified_at = _verify_cache.get(cache_key)
+        if verified_at is None:
+            return False
+        if now - verified_at > _VERIFY_CACHE_TTL_SECONDS:
+            del _verify_cache[cache_key]
+            return False
+        return True
+
+
+def _remember_verified(cache_key: bytes) -> None:
+    """Record a successful verification, evicting the oldest entry if full.
+    
+    Args:
+        cache_key: Keyed digest of the password and hash
+    """
+    with _verify_cache_lock:
+        _verify_cache[cache_key] = time.monotonic()
+        _verify_cache.move_to_end(cache_key)
+        if len(_verify_cache) > _VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+
+
+async def ahash_password(password: str, rounds: int = 12) -> str:
+    """Hash a password without blocking the event loop.
+    
+    Runs hash_password in a worker thread. bcrypt releases the GIL while
+    hashing, so concurrent logins use separate cores instead of stalling
+    every other request on the loop.
+    
+    Args:
+        password: The plain text password to hash
+        rounds: The bcrypt work factor (default: 12)
+    
+    Returns:
+        The hashed password as a UTF-8 string, including the salt
+    
+    Raises:
+        ValueError: If password is empty or rounds is invalid
+    
+    Example:
+        >>> hashed = await ahash_password("secure_password123")
+    """
+    return await asyncio.to_thread(hash_password, password, rounds)
+
+
+async def averify_password(password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop.
+    
+    Async counterpart of verify_password for ``async def`` route handlers;
+    the bcrypt check runs in a worker thread.
+    
+    Args:
+        password: The plain text password to verify
+        hashed_password: The bcrypt hash to compare against
+    
+    Returns:
+        True if the password matches the hash, False otherwise
+    
+    Example:
+        >>> if await averify_password(password, user.password_hash):
+        ...     print("Welcome back")
+    """
+    return await asyncio.to_thread(verify_password, password, hashed_password)
 
 
 def needs_rehash(hashed_password: str, target_rounds: int = 12) -> bool:
@@ -120,13 +248,9 @@ def needs_rehash(hashed_password: str, target_rounds: int = 12) -> bool:
         - Use this during login to upgrade old hashes
         - Rehashing improves security as computing power increases
     """
-    try:
-        # Extract rounds from hash (format: $2b$12$...)
-        parts = hashed_password.split('$')
-        if len(parts) < 4:
-            return True
-        
-        current_rounds = int(parts[2])
-        return current_rounds != target_rounds
-    except (ValueError, IndexError):
+    # Extract rounds from hash (format: $2b$12$...)
+    match = _BCRYPT_COST_RE.match(hashed_password or "")
+    if not match:
         return True
+    
+    return int(match.group(1)) != target_rounds
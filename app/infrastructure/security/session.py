@@ -14,10 +14,12 @@ Example:
     >>> user = get_current_user(request, db)
 """
 
+import inspect
+import sys
+import time
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, Callable
-from datetime import datetime, timedelta
 from functools import wraps
-from app.infrastructure.database.connection import engine
 
 from fasthtml.common import Request, RedirectResponse
 from sqlalchemy.orm import Session
@@ -26,6 +28,29 @@ from app.domain.models.user import User, UserRole
 from app.config import get_settings
 
 
+@dataclass(frozen=True, slots=True)
+class UserView:
+    """Read-only snapshot of the authenticated user.
+    
+    Returned by get_current_user() instead of the ORM User so that route
+    handlers and templates cannot trigger lazy loads or modify the row.
+    Use UserRepository when the full model is needed.
+    
+    Attributes:
+        id: User's unique identifier
+        email: User's email address
+        role: User's role (student/supervisor)
+        full_name: User's full name
+        is_active: Whether the account is active
+    """
+    
+    id: str
+    email: str
+    role: UserRole
+    full_name: str
+    is_active: bool
+
+
 def create_session(user: User) -> Dict[str, Any]:
     """Create a session dictionary for a user.
     
@@ -38,10 +63,10 @@ def create_session(user: User) -> Dict[str, Any]:
     Returns:
         Dictionary containing session data with keys:
             - user_id: User's unique identifier
-            - email: User's email address
             - role: User's role (student/supervisor)
             - full_name: User's full name
-            - created_at: Session creation timestamp
+            - created_at: Session creation time (unix seconds)
+            - expires_at: Session expiry time (unix seconds)
     
     Example:
         >>> session_data = create_session(user)
@@ -54,31 +79,30 @@ def create_session(user: User) -> Dict[str, Any]:
         - Session expiry is handled by FastHTML configuration
     """
     settings = get_settings()
+    now = int(time.time())
     
     return {
         'user_id': user.id,
-        'email': user.email,
         'role': user.role.value,
         'full_name': user.full_name,
-        'created_at': datetime.utcnow().isoformat(),
-        'expires_at': (
-            datetime.utcnow() + timedelta(hours=settings.session_lifetime_hours)
-        ).isoformat(),
+        'created_at': now,
+        'expires_at': now + settings.session_lifetime_hours * 3600,
     }
 
 
-def get_current_user(request: Request, db: Session) -> Optional[User]:
+def get_current_user(request: Request, db: Session) -> Optional[UserView]:
     """Get the currently authenticated user from the request.
     
-    Retrieves the user object for the currently authenticated session by
-    extracting the user_id from the session and querying the database.
+    Retrieves the user for the currently authenticated session by
+    extracting the user_id from the session and selecting the few columns
+    request handling needs.
     
     Args:
         request: The FastHTML request object containing session data
         db: Database session for querying user data
     
     Returns:
-        The authenticated User object, or None if not authenticated
+        A UserView of the authenticated user, or None if not authenticated
     
     Example:
         >>> user = get_current_user(request, db)
@@ -91,7 +115,15 @@ def get_current_user(request: Request, db: Session) -> Optional[User]:
         - Returns None if session is missing or expired
         - Returns None if user is not found in database
         - Does not verify session expiry (handled by FastHTML)
+        - The user is memoized on request.state.current_user, so repeated
+          calls during one request (decorators, handler) query only once
     """
+    # Reuse the user already loaded for this request
+    state = getattr(request, 'state', None)
+    cached = getattr(state, 'current_user', None)
+    if cached is not None:
+        return cached
+    
     # Get session from request
     session = getattr(request, 'session', None)
     if not session:
@@ -102,61 +134,100 @@ def get_current_user(request: Request, db: Session) -> Optional[User]:
     if not user_id:
         return None
     
-    # Check session expiry
-    expires_at_str = session.get('expires_at')
-    if expires_at_str:
-        try:
-            expires_at = datetime.fromisoformat(expires_at_str)
-            if datetime.utcnow() > expires_at:
-                return None
-        except (ValueError, TypeError):
+    # Check session expiry (unix timestamp; anything else is a stale cookie)
+    expires_at = session.get('expires_at')
+    if expires_at is not None:
+        if not isinstance(expires_at, (int, float)) or time.time() > expires_at:
             return None
     
-    # Defensive fix: Ensure session is bound
-    if db.bind is None:
-        db.bind = engine
+    # Query only the columns request handling reads (no password_hash, no
+    # ORM instance or relationships to lazy-load)
+    row = db.query(
+        User.id, User.email, User.role, User.full_name, User.is_active
+    ).filter(User.id == user_id).first()
+    if row is None:
+        return None
     
-    # Query user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    user = UserView(*row)
+    if state is not None:
+        state.current_user = user
     return user
 
 
-def require_auth(redirect_to: str = "/login"):
-    """Decorator to require authentication for a route.
+def _param_position(func: Callable, name: str) -> int:
+    """Get the positional index of a handler parameter.
     
-    Wraps a FastHTML route handler to ensure the user is authenticated.
-    If not authenticated, redirects to the login page.
+    Resolved once when a route is decorated so the per-request wrapper can
+    index ``args`` directly instead of probing several fallbacks.
     
     Args:
-        redirect_to: URL to redirect to if not authenticated (default: "/login")
+        func: The route handler being decorated
+        name: The parameter name to locate
+    
+    Returns:
+        Index of the parameter in ``args``, or sys.maxsize if it cannot be
+        passed positionally (so the wrapper always falls back to kwargs)
+    """
+    positional = [
+        param.name
+        for param in inspect.signature(func).parameters.values()
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+    ]
+    return positional.index(name) if name in positional else sys.maxsize
+
+
+def auth(
+    *allowed_roles: UserRole,
+    redirect_login: str = "/login",
+    redirect_unauth: str = "/unauthorized"
+):
+    """Decorator to require authentication and, optionally, a role.
+    
+    Performs the checks of @require_auth() and @require_role() in a single
+    wrapper, so a protected route costs one extra call frame instead of two.
+    
+    Args:
+        *allowed_roles: UserRole values allowed to access the route; any
+            authenticated user is allowed when none are given
+        redirect_login: URL to redirect to if not authenticated (default: "/login")
+        redirect_unauth: URL to redirect to if not authorized (default: "/unauthorized")
     
     Returns:
         Decorator function that wraps route handlers
     
     Example:
-        >>> @app.get("/dashboard")
-        >>> @require_auth()
-        >>> def dashboard(request: Request, db: Session):
-        ...     user = get_current_user(request, db)
-        ...     return f"Welcome, {user.full_name}!"
+        >>> @app.get("/supervisor/dashboard")
+        >>> @auth(UserRole.SUPERVISOR)
+        >>> def supervisor_dashboard(request: Request, db: Session, current_user: UserView):
+        ...     return "Supervisor Dashboard"
     
     Note:
         - The wrapped function must accept 'request' and 'db' parameters
         - Adds 'current_user' to the function's keyword arguments
-        - Returns RedirectResponse if authentication fails
+        - Returns RedirectResponse if authentication or role check fails
     """
+    roles = frozenset(allowed_roles)
+    
     def decorator(func: Callable):
+        request_pos = _param_position(func, 'request')
+        db_pos = _param_position(func, 'db')
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Extract request and db from args/kwargs
-            request = kwargs.get('request') or (args[0] if args else None)
+            # Extract request and db using positions resolved at decoration
+            request = args[request_pos] if request_pos < len(args) else kwargs.get('request')
+            db = args[db_pos] if db_pos < len(args) else kwargs.get('db')
             
-            # Try to get db from kwargs/args, then request.state
-            db = kwargs.get('db') or (args[1] if len(args) > 1 else None)
-            if not db and request and hasattr(request.state, "db"):
-                db = request.state.db
-                # Inject into kwargs for the wrapped function
-                kwargs['db'] = db
+            # Fall back to the session opened by DBSessionMiddleware. FastHTML
+            # injects an unbound Session() for a ``db: Session`` parameter,
+            # so that is replaced as well.
+            if getattr(db, "bind", None) is None and request is not None:
+                db = getattr(request.state, "db", None)
+                # Inject into the arguments for the wrapped function
+                if db_pos < len(args):
+                    args = args[:db_pos] + (db,) + args[db_pos + 1:]
+                else:
+                    kwargs['db'] = db
             
             if not request or not db:
                 raise ValueError(
@@ -166,7 +237,11 @@ def require_auth(redirect_to: str = "/login"):
             # Check authentication
             user = get_current_user(request, db)
             if not user:
-                return RedirectResponse(url=redirect_to, status_code=303)
+                return RedirectResponse(url=redirect_login, status_code=303)
+            
+            # Check role
+            if roles and user.role not in roles:
+                return RedirectResponse(url=redirect_unauth, status_code=303)
             
             # Add user to kwargs
             kwargs['current_user'] = user
@@ -176,6 +251,34 @@ def require_auth(redirect_to: str = "/login"):
     return decorator
 
 
+def require_auth(redirect_to: str = "/login"):
+    """Decorator to require authentication for a route.
+    
+    Wraps a FastHTML route handler to ensure the user is authenticated.
+    If not authenticated, redirects to the login page.
+    
+    Args:
+        redirect_to: URL to redirect to if not authenticated (default: "/login")
+    
+    Returns:
+        Decorator function that wraps route handlers
+    
+    Example:
+        >>> @app.get("/dashboard")
+        >>> @require_auth()
+        >>> def dashboard(request: Request, db: Session):
+        ...     user = get_current_user(request, db)
+        ...     return f"Welcome, {user.full_name}!"
+    
+    Note:
+        - Equivalent to @auth() with no roles
+        - The wrapped function must accept 'request' and 'db' parameters
+        - Adds 'current_user' to the function's keyword arguments
+        - Returns RedirectResponse if authentication fails
+    """
+    return auth(redirect_login=redirect_to)
+
+
 def require_role(*allowed_roles: UserRole, redirect_to: str = "/unauthorized"):
     """Decorator to require specific roles for a route.
     
@@ -193,14 +296,17 @@ def require_role(*allowed_roles: UserRole, redirect_to: str = "/unauthorized"):
         >>> @app.get("/supervisor/dashboard")
         >>> @require_auth()
         >>> @require_role(UserRole.SUPERVISOR)
-        >>> def supervisor_dashboard(request: Request, db: Session, current_user: User):
+        >>> def supervisor_dashboard(request: Request, db: Session, current_user: UserView):
         ...     return "Supervisor Dashboard"
     
     Note:
-        - Should be used together with @require_auth()
+        - Should be used together with @require_auth(); prefer
+          @auth(*allowed_roles), which does both checks in one wrapper
         - The wrapped function must have 'current_user' in kwargs
         - Returns RedirectResponse if role check fails
     """
+    roles = frozenset(allowed_roles)
+    
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -213,7 +319,7 @@ def require_role(*allowed_roles: UserRole, redirect_to: str = "/unauthorized"):
                 )
             
             # Check role
-            if user.role not in allowed_roles:
+            if user.role not in roles:
                 return RedirectResponse(url=redirect_to, status_code=303)
             
             return func(*args, **kwargs)
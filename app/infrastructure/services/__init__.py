@@ -9,9 +9,15 @@ Modules:
 """
 
 from app.infrastructure.services.geofence import GeofenceService
-from app.infrastructure.services.daily_client import DailyClient
+from app.infrastructure.services.daily_client import (
+    DailyClient,
+    get_daily_client,
+    close_daily_client,
+)
 
 __all__ = [
     "GeofenceService",
     "DailyClient",
+    "get_daily_client",
+    "close_daily_client",
 ]
@@ -18,9 +18,50 @@ Example:
     >>> print(room['url'])
 """
 
+import asyncio
+import importlib.util
+import time
 import httpx
+from types import MappingProxyType
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+
+from app.config import get_settings
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Transient upstream failures; Daily.co may already have acted on the request,
+# so these are only retried for idempotent methods
+_TRANSIENT_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_MAX_RETRIES = 3
+_BACKOFF_BASE_SECONDS = 0.2
+_MAX_BACKOFF_SECONDS = 10.0
+
+# Process-wide client shared by get_daily_client(); closed on app shutdown
+_shared_client: Optional["DailyClient"] = None
+
+
+def _should_retry(method: str, response: httpx.Response) -> bool:
+    """Decide whether a failed Daily.co request can safely be sent again.
+    
+    A 429, or a 503 carrying Retry-After, means the request was turned away
+    unprocessed, so any method is retried. Other 5xx responses may come after
+    the request took effect (e.g. a room was created), so they are retried
+    only for idempotent methods; a retried POST /rooms could create a
+    duplicate room.
+    
+    Args:
+        method: HTTP method of the request
+        response: The response received
+    
+    Returns:
+        True if the request should be retried
+    """
+    status = response.status_code
+    if status == 429 or (status == 503 and "Retry-After" in response.headers):
+        return True
+    return status in _TRANSIENT_STATUSES and method.upper() in _IDEMPOTENT_METHODS
 
 
 class DailyClient:
@@ -34,32 +75,125 @@ class DailyClient:
         base_url: Base URL for Daily.co API (default: https://api.daily.co/v1)
     
     Example:
-        >>> client = DailyClient(api_key="your_api_key")
-        >>> room = await client.create_room(name="consultation-123")
+        >>> async with DailyClient(api_key="your_api_key") as client:
+        ...     room = await client.create_room(name="consultation-123")
     
     Note:
         - Requires a Daily.co account and API key
         - Free tier includes 10,000 minutes/month
         - All methods are async and require await
+        - One pooled httpx.AsyncClient is reused across calls so
+          connections (and their TLS sessions) are kept alive; call
+          aclose() or use the client as an async context manager when done
     """
     
+    # API paths, relative to base_url
+    _ROOMS_URL = "/rooms"
+    _MEETING_TOKENS_URL = "/meeting-tokens"
+    
     def __init__(
         self,
         api_key: str,
-        base_url: str = "https://api.daily.co/v1"
+        base_url: str = "https://api.daily.co/v1",
+        max_concurrent: int = 32
     ):
         """Initialize the Daily.co client.
         
         Args:
             api_key: Daily.co API key
             base_url: Base URL for the API (default: https://api.daily.co/v1)
+            max_concurrent: Maximum requests in flight to Daily.co at once
+                (default: 32); raise it for accounts with higher rate limits
         """
         self.api_key = api_key
         self.base_url = base_url
-        self.headers = {
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.headers = MappingProxyType({
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
-        }
+        })
+        # The transport owns the pool; its retries cover failed connection
+        # attempts, while retryable status codes are handled by _request()
+        transport = httpx.AsyncHTTPTransport(
+            http2=_HTTP2_AVAILABLE,
+            retries=_MAX_RETRIES,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300
+            )
+        )
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=self.headers,
+            timeout=httpx.Timeout(10.0),
+            transport=transport
+        )
+    
+    async def __aenter__(self) -> "DailyClient":
+        """Enter the async context manager.
+        
+        Returns:
+            This client
+        """
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the underlying HTTP client on exit."""
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close pooled connections held by the client.
+        
+        Example:
+            >>> client = DailyClient(api_key="your_api_key")
+            >>> try:
+            ...     rooms = await client.list_rooms()
+            ... finally:
+            ...     await client.aclose()
+        """
+        await self._client.aclose()
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, backing off and retrying on 429 and 5xx responses.
+        
+        Only responses accepted by _should_retry() are retried. Waits for
+        the Retry-After header when Daily.co sends one, otherwise
+        0.2s, 0.4s, 0.8s. Sleeping uses asyncio so the event loop keeps
+        serving other requests. At most max_concurrent requests are in
+        flight at once; a slot is not held while backing off.
+        
+        Args:
+            method: HTTP method
+            url: Path relative to base_url
+            **kwargs: Passed through to httpx.AsyncClient.request()
+        
+        Returns:
+            The successful response
+        
+        Raises:
+            httpx.HTTPStatusError: If the final attempt is not successful
+        """
+        for attempt in range(_MAX_RETRIES + 1):
+            async with self._semaphore:
+                response = await self._client.request(method, url, **kwargs)
+            if attempt == _MAX_RETRIES or not _should_retry(method, response):
+                break
+            
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = min(float(retry_after), _MAX_BACKOFF_SECONDS)
+            else:
+                delay = _BACKOFF_BASE_SECONDS * 2 ** attempt
+            await asyncio.sleep(delay)
+        
+        response.raise_for_status()
+        return response
     
     async def create_room(
         self,
@@ -108,7 +242,7 @@ class DailyClient:
             - Free tier has limits on concurrent rooms
         """
         # Calculate expiration time
-        exp_time = datetime.utcnow() + timedelta(minutes=exp_minutes)
+        exp_time = int(time.time()) + exp_minutes * 60
         
         # Prepare room properties
         properties = {
@@ -117,7 +251,7 @@ class DailyClient:
             "start_video_off": start_video_off,
             "start_audio_off": start_audio_off,
             "max_participants": max_participants,
-            "exp": int(exp_time.timestamp())
+            "exp": exp_time
         }
         
         # Prepare request payload
@@ -130,14 +264,8 @@ class DailyClient:
             payload["name"] = name
         
         # Make API request
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/rooms",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("POST", self._ROOMS_URL, json=payload)
+        return response.json()
     
     async def get_room(self, room_name: str) -> Dict[str, Any]:
         """Get details of an existing room.
@@ -155,13 +283,8 @@ class DailyClient:
         Raises:
             httpx.HTTPError: If the room is not found or API request fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/rooms/{room_name}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("GET", f"{self._ROOMS_URL}/{room_name}")
+        return response.json()
     
     async def delete_room(self, room_name: str) -> Dict[str, Any]:
         """Delete a room.
@@ -183,13 +306,8 @@ class DailyClient:
             - Deleting a room ends any active calls
             - This action cannot be undone
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/rooms/{room_name}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("DELETE", f"{self._ROOMS_URL}/{room_name}")
+        return response.json()
     
     async def create_meeting_token(
         self,
@@ -228,7 +346,7 @@ class DailyClient:
             - Owner can control room settings and end calls
         """
         # Calculate expiration time
-        exp_time = datetime.utcnow() + timedelta(minutes=exp_minutes)
+        exp_time = int(time.time()) + exp_minutes * 60
         
         # Prepare token properties
         properties = {
@@ -236,19 +354,17 @@ class DailyClient:
             "user_name": user_name,
             "is_owner": is_owner,
             "enable_recording": enable_recording,
-            "exp": int(exp_time.timestamp())
+            "exp": exp_time
         }
         
         # Make API request
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/meeting-tokens",
-                headers=self.headers,
-                json={"properties": properties}
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result["token"]
+        response = await self._request(
+            "POST",
+            self._MEETING_TOKENS_URL,
+            json={"properties": properties}
+        )
+        result = response.json()
+        return result["token"]
     
     async def list_rooms(
         self,
@@ -278,11 +394,41 @@ class DailyClient:
         if ending_before:
             params["ending_before"] = ending_before
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/rooms",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("GET", self._ROOMS_URL, params=params)
+        return response.json()
+
+
+def get_daily_client() -> DailyClient:
+    """Get the process-wide Daily.co client.
+    
+    Created on first use from settings and reused afterwards, so every
+    caller shares one connection pool.
+    
+    Returns:
+        The shared DailyClient instance
+    
+    Raises:
+        ValueError: If DAILY_API_KEY is not configured
+    
+    Example:
+        >>> client = get_daily_client()
+        >>> room = await client.create_room(name="consultation-123")
+    """
+    global _shared_client
+    if _shared_client is None:
+        settings = get_settings()
+        if not settings.daily_api_key:
+            raise ValueError("DAILY_API_KEY must be set in environment")
+        _shared_client = DailyClient(settings.daily_api_key)
+    return _shared_client
+
+
+async def close_daily_client() -> None:
+    """Close the shared Daily.co client, if one was created.
+    
+    Registered as an application shutdown handler in main.py.
+    """
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -1,7 +1,10 @@
 """Geofence validation and distance calculation service.
 
 This module provides utilities for validating GPS coordinates against geofence
-boundaries using the Haversine formula for accurate distance calculations.
+boundaries. Point-to-point distances use the Haversine formula; geofence
+containment and the distance reported with it use a flat-earth
+(equirectangular) approximation, the same one the log repository runs in SQL,
+so a log near the boundary gets the same verdict everywhere.
 
 Example:
     >>> from app.infrastructure.services.geofence import GeofenceService
@@ -16,11 +19,106 @@ Example:
 """
 
 import math
-from typing import Tuple
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
 from app.domain.models.placement import Geofence
 from app.domain.models.log import LocationStatus
 
+try:
+    from numba import njit
+except ImportError:  # Optional accelerator; pure Python is used without it
+    njit = None
+
+# Earth's radius in meters
+_EARTH_RADIUS_METERS = 6371000.0
+
+
+
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two points in decimal degrees.
+    
+    Kept as a plain module-level function of floats so that it can be
+    compiled to native code with Numba when that package is installed.
+    """
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = math.radians(lon2) - math.radians(lon1)
+    
+    a = (
+        math.sin(dlat / 2) ** 2 +
+        math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+    )
+    return _EARTH_RADIUS_METERS * 2 * math.asin(math.sqrt(a))
+
+
+if njit is not None:
+    _haversine = njit(cache=True)(_haversine)
+
+
+@lru_cache(maxsize=1024)
+def _geofence_anchor(
+    center_lat: float,
+    center_lon: float
+) -> Tuple[float, float, float]:
+    """Per-center invariants of the distance formulas.
+    
+    Cached by value, so a geofence checked against many points converts its
+    center only once, and a moved geofence gets a fresh entry.
+    
+    Args:
+        center_lat: Latitude of the geofence center in decimal degrees
+        center_lon: Longitude of the geofence center in decimal degrees
+    
+    Returns:
+        Tuple of (latitude radians, longitude radians, cosine of latitude)
+    """
+    center_lat_rad = math.radians(center_lat)
+    return center_lat_rad, math.radians(center_lon), math.cos(center_lat_rad)
+
+
+def _flat_distance_squared(
+    latitude: float,
+    longitude: float,
+    center_lat: float,
+    center_lon: float,
+    cos_center_lat: float
+) -> float:
+    """Squared equirectangular distance in square meters to a geofence center.
+    
+    Geofence radii are capped at 5 km (see settings), where the error of this
+    approximation is well under 0.1%. LogRepository.get_logs_outside_geofence
+    evaluates the same expression in SQL.
+    """
+    dy = math.radians(latitude - center_lat) * _EARTH_RADIUS_METERS
+    dx = (
+        math.radians(longitude - center_lon) * cos_center_lat * _EARTH_RADIUS_METERS
+    )
+    return dx * dx + dy * dy
+
+
+@lru_cache(maxsize=1024)
+def _bounding_box(center_lat: float, radius_meters: float) -> Tuple[float, float]:
+    """Half-height and half-width in degrees of a box enclosing a geofence.
+    
+    Padded by 1% so that no point inside the circle falls outside the box.
+    Cached by value, so edits to a geofence's center or radius are picked up
+    automatically.
+    
+    Args:
+        center_lat: Latitude of the geofence center in decimal degrees
+        radius_meters: Geofence radius in meters
+    
+    Returns:
+        Tuple of (max latitude offset, max longitude offset) in degrees
+    """
+    max_angle = math.degrees(radius_meters / _EARTH_RADIUS_METERS) * 1.01
+    cos_lat = math.cos(math.radians(center_lat))
+    if cos_lat < 1e-9:
+        return max_angle, math.inf
+    return max_angle, min(max_angle / cos_lat, 180.0)
+
 
 class GeofenceService:
     """Service for geofence validation and distance calculations.
@@ -75,26 +173,127 @@ class GeofenceService:
             - Assumes Earth is a perfect sphere (good approximation for short distances)
             - Accuracy decreases for very long distances
             - Returns 0 if coordinates are identical
+            - Runs as native code when the optional numba package is
+              installed (compiled on first use, cached on disk)
         """
-        # Convert latitude and longitude to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
+        return _haversine(float(lat1), float(lon1), float(lat2), float(lon2))
+    
+    @staticmethod
+    def calculate_distance_from_anchor(
+        lat: float,
+        lon: float,
+        center_lat_rad: float,
+        center_lon_rad: float,
+        cos_center_lat: float
+    ) -> float:
+        """Calculate the Haversine distance to a pre-converted center point.
+        
+        Same result as calculate_distance(), but takes the center already in
+        radians together with the cosine of its latitude, as produced once
+        per geofence by the cached anchor helper.
         
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
+        Args:
+            lat: Latitude of the point in decimal degrees
+            lon: Longitude of the point in decimal degrees
+            center_lat_rad: Latitude of the center in radians
+            center_lon_rad: Longitude of the center in radians
+            cos_center_lat: Cosine of center_lat_rad
         
+        Returns:
+            Distance in meters
+        """
+        lat_rad = math.radians(lat)
+        half_dlat = (center_lat_rad - lat_rad) / 2
+        half_dlon = (center_lon_rad - math.radians(lon)) / 2
         a = (
-            math.sin(dlat / 2) ** 2 +
-            math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+            math.sin(half_dlat) ** 2 +
+            math.cos(lat_rad) * cos_center_lat * math.sin(half_dlon) ** 2
+        )
+        return 2 * _EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+    
+    @staticmethod
+    def calculate_distances(
+        points: Iterable[Tuple[float, float]],
+        center_lat: float,
+        center_lon: float
+    ) -> List[float]:
+        """Calculate distances from many GPS coordinates to one center point.
+        
+        Batch form of calculate_distance() for checking many logs against
+        the same geofence. The center's radians and cosine come from the
+        cached anchor rather than being recomputed, and the per-point work
+        runs inline in a single loop.
+        
+        Args:
+            points: (latitude, longitude) pairs in decimal degrees
+            center_lat: Latitude of the center point in decimal degrees
+            center_lon: Longitude of the center point in decimal degrees
+        
+        Returns:
+            Distances in meters, in the same order as ``points``
+        
+        Example:
+            >>> distances = GeofenceService.calculate_distances(
+            ...     [(6.5250, 3.3800), (6.5400, 3.3900)],
+            ...     center_lat=6.5244, center_lon=3.3792
+            ... )
+        """
+        radians, sin, cos, asin, sqrt = (
+            math.radians, math.sin, math.cos, math.asin, math.sqrt
+        )
+        center_lat_rad, center_lon_rad, cos_center_lat = _geofence_anchor(
+            center_lat, center_lon
         )
-        c = 2 * math.asin(math.sqrt(a))
+        diameter = 2 * _EARTH_RADIUS_METERS
+        
+        distances = []
+        for lat, lon in points:
+            lat_rad = radians(lat)
+            half_dlat = (center_lat_rad - lat_rad) / 2
+            half_dlon = (center_lon_rad - radians(lon)) / 2
+            a = (
+                sin(half_dlat) ** 2 +
+                cos(lat_rad) * cos_center_lat * sin(half_dlon) ** 2
+            )
+            distances.append(diameter * asin(sqrt(a)))
+        return distances
+    
+    def is_within_geofence_batch(
+        self,
+        points: Iterable[Tuple[float, float]],
+        geofence: Geofence
+    ) -> List[bool]:
+        """Check many GPS coordinates against a geofence boundary.
+        
+        Args:
+            points: (latitude, longitude) pairs in decimal degrees
+            geofence: The Geofence object defining the boundary
+        
+        Returns:
+            One boolean per point, True if it lies within the geofence
+        
+        Example:
+            >>> flags = service.is_within_geofence_batch(
+            ...     [(log.latitude, log.longitude) for log in logs],
+            ...     geofence
+            ... )
         
-        # Calculate distance
-        distance = GeofenceService.EARTH_RADIUS_METERS * c
-        return distance
+        Note:
+            - Returns all False if geofence is None
+            - Same containment test as is_within_geofence()
+        """
+        if not geofence:
+            return [False for _ in points]
+        
+        center_lat, center_lon = geofence.latitude, geofence.longitude
+        cos_center_lat = _geofence_anchor(center_lat, center_lon)[2]
+        max_squared = geofence.radius_meters * geofence.radius_meters
+        return [
+            _flat_distance_squared(
+                lat, lon, center_lat, center_lon, cos_center_lat
+            ) <= max_squared
+            for lat, lon in points
+        ]
     
     def is_within_geofence(
         self,
@@ -114,8 +313,8 @@ class GeofenceService:
         
         Example:
             >>> geofence = Geofence(
-            ...     center_latitude=6.5244,
-            ...     center_longitude=3.3792,
+            ...     latitude=6.5244,
+            ...     longitude=3.3792,
             ...     radius_meters=500
             ... )
             >>> service = GeofenceService()
@@ -127,19 +326,47 @@ class GeofenceService:
         
         Note:
             - Returns False if geofence is None
-            - Uses Haversine formula for accurate distance calculation
+            - Points outside the geofence's bounding box are rejected with
+              two comparisons before any distance is computed
+            - Containment uses the equirectangular approximation, compared
+              in squared meters (no trig beyond one cached cosine, no sqrt)
         """
         if not geofence:
             return False
         
-        distance = self.calculate_distance(
-            lat1=latitude,
-            lon1=longitude,
-            lat2=geofence.center_latitude,
-            lon2=geofence.center_longitude
+        return self._is_within_unchecked(latitude, longitude, geofence)
+    
+    def _is_within_unchecked(
+        self,
+        latitude: float,
+        longitude: float,
+        geofence: Geofence
+    ) -> bool:
+        """Containment test behind is_within_geofence(), without the None check.
+        
+        Args:
+            latitude: Latitude of the point to check
+            longitude: Longitude of the point to check
+            geofence: The Geofence object defining the boundary (not None)
+        
+        Returns:
+            True if the point is within the geofence, False otherwise
+        """
+        # Cheap reject for points clearly outside (e.g. in another city)
+        center_lat = geofence.latitude
+        max_dlat, max_dlon = _bounding_box(center_lat, geofence.radius_meters)
+        if (
+            abs(latitude - center_lat) > max_dlat
+            or abs(longitude - geofence.longitude) > max_dlon
+        ):
+            return False
+        
+        cos_center_lat = _geofence_anchor(center_lat, geofence.longitude)[2]
+        distance_squared = _flat_distance_squared(
+            latitude, longitude, center_lat, geofence.longitude, cos_center_lat
         )
         
-        return distance <= geofence.radius_meters
+        return distance_squared <= geofence.radius_meters * geofence.radius_meters
     
     def get_location_status(
         self,
@@ -170,16 +397,16 @@ class GeofenceService:
             - Returns UNKNOWN if geofence is None
             - Returns UNKNOWN if coordinates are invalid (0, 0)
         """
-        # Check for invalid coordinates
-        if latitude == 0 and longitude == 0:
+        # Check if geofence exists
+        if geofence is None:
             return LocationStatus.UNKNOWN
         
-        # Check if geofence exists
-        if not geofence:
+        # Check for invalid coordinates
+        if latitude == 0 and longitude == 0:
             return LocationStatus.UNKNOWN
         
         # Check if within geofence
-        if self.is_within_geofence(latitude, longitude, geofence):
+        if self._is_within_unchecked(latitude, longitude, geofence):
             return LocationStatus.WITHIN
         else:
             return LocationStatus.OUTSIDE
@@ -212,17 +439,22 @@ class GeofenceService:
         Note:
             - Useful for showing users how far they are from the geofence
             - Can be used to provide feedback in the UI
+            - Uses the same approximation as is_within_geofence(), so
+              is_within always agrees with it
         """
-        distance = self.calculate_distance(
-            lat1=latitude,
-            lon1=longitude,
-            lat2=geofence.center_latitude,
-            lon2=geofence.center_longitude
+        center_lat, center_lon = geofence.latitude, geofence.longitude
+        distance_squared = _flat_distance_squared(
+            latitude,
+            longitude,
+            center_lat,
+            center_lon,
+            _geofence_anchor(center_lat, center_lon)[2]
         )
         
-        is_within = distance <= geofence.radius_meters
+        radius = geofence.radius_meters
+        is_within = distance_squared <= radius * radius
         
-        return distance, is_within
+        return math.sqrt(distance_squared), is_within
     
     @staticmethod
     def validate_coordinates(latitude: float, longitude: float) -> bool:
@@ -245,8 +477,4 @@ class GeofenceService:
             - Latitude must be between -90 and 90
             - Longitude must be between -180 and 180
         """
-        if not (-90 <= latitude <= 90):
-            return False
-        if not (-180 <= longitude <= 180):
-            return False
-        return True
+        return -90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0
@@ -53,10 +53,10 @@ function appendMessage(text, time, isMe) {
     const bubbleHtml = `
         <div class="d-flex ${align} mb-3">
             <div class="d-flex flex-column ${alignItems}">
-                <div class="p-3 ${bg} ${radius}" style="max-width: 80%; box-shadow: 0 1px 2px rgba(0,0,0,0.05);">
+                <div class="chat-bubble p-3 ${bg} ${radius}">
                     ${text}
                 </div>
-                <div class="text-muted small mt-1 mx-1" style="font-size: 0.7rem;">${time}</div>
+                <div class="chat-bubble-time text-muted small mt-1 mx-1">${time}</div>
             </div>
         </div>
     `;
@@ -107,8 +107,19 @@ async function sendChatMessage(event) {
     return false;
 }
 
+// Keep the chat scrolled to the latest message
+function scrollChatToBottom() {
+    const list = document.getElementById('chat-messages-list');
+    if (list) list.scrollTop = list.scrollHeight;
+}
+
+// Re-scroll whenever htmx swaps in new content (e.g. switching tabs)
+document.addEventListener('htmx:afterSwap', scrollChatToBottom);
+
 // Initialize SSE connection on page load
 document.addEventListener('DOMContentLoaded', function() {
+    scrollChatToBottom();
+    
     // Get recipient ID from hidden input
     const recipientInput = document.querySelector('input[name="recipient_id"]');
     if (recipientInput && recipientInput.value) {
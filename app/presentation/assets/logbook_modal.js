@@ -0,0 +1,93 @@
+// Logbook Modal - GPS capture and offline submission for the log entry form
+
+// Fill the hidden GPS fields and enable submit once a position is acquired
+function captureLocation() {
+    if (navigator.geolocation) {
+        navigator.geolocation.getCurrentPosition(
+            (position) => {
+                document.getElementById('latitude').value = position.coords.latitude;
+                document.getElementById('longitude').value = position.coords.longitude;
+                document.getElementById('gps-coords').textContent =
+                    position.coords.latitude.toFixed(6) + ', ' + position.coords.longitude.toFixed(6);
+                document.getElementById('gps-status').textContent = 'Location acquired ✓';
+                document.getElementById('gps-alert').className = 'alert alert-success';
+                document.getElementById('submit-btn').disabled = false;
+            },
+            (error) => {
+                document.getElementById('gps-status').textContent = 'Location required - Please enable GPS';
+                document.getElementById('gps-alert').className = 'alert alert-danger';
+            }
+        );
+    } else {
+        document.getElementById('gps-status').textContent = 'GPS not supported';
+        document.getElementById('gps-alert').className = 'alert alert-danger';
+    }
+}
+
+// Save the entry through SyncManager (IndexedDB first, then sync if online)
+async function submitLogEntry(e) {
+    e.preventDefault();
+    
+    const form = e.currentTarget;
+    const submitBtn = document.getElementById('submit-btn');
+    const originalText = submitBtn.textContent;
+    submitBtn.disabled = true;
+    submitBtn.textContent = 'Saving...';
+    
+    try {
+        // Gather data
+        const formData = new FormData(form);
+        const data = Object.fromEntries(formData.entries());
+        
+        // Save specific types
+        data.week_number = form.dataset.weekNumber;
+        
+        // Save to IndexedDB via SyncManager
+        if (window.syncManager) {
+            await window.syncManager.saveLog(data);
+            console.log("Saved to IndexedDB");
+            
+            // Try sync if online
+            if (navigator.onLine) {
+                await window.syncManager.syncWithServer();
+            } else {
+                alert("Saved offline. Will sync when online.");
+            }
+        } else {
+            // Fallback if sync manager missing (shouldn't happen)
+            alert("Sync manager not loaded!");
+        }
+        
+        // Reload to show updates (served from DB or local)
+        window.location.reload();
+    } catch (err) {
+        console.error("Save error:", err);
+        alert("Error saving log: " + err.message);
+        submitBtn.disabled = false;
+        submitBtn.textContent = originalText;
+    }
+}
+
+// Wire up a freshly loaded log entry form
+function initLogEntryForm(form) {
+    form.addEventListener('submit', submitLogEntry);
+    
+    // New entries carry hidden GPS fields; existing ones are already located
+    if (form.elements.latitude) {
+        captureLocation();
+    }
+    
+    // Character counter
+    const textarea = form.querySelector('textarea[name="activity_description"]');
+    const charCount = document.getElementById('char-count');
+    if (textarea && charCount) {
+        textarea.addEventListener('input', () => {
+            charCount.textContent = textarea.value.length;
+        });
+    }
+}
+
+// The modal body is loaded by htmx, so initialize after each swap
+document.addEventListener('htmx:afterSwap', function(e) {
+    e.target.querySelectorAll('form[data-week-number]').forEach(initLogEntryForm);
+});
@@ -1,23 +1,20 @@
-"""Authentication components for login and registration."""
+"""Authentication components for login and registration.
+
+The invariant part of the login form is rendered on first use, after
+component defaults are set, and cached.
+"""
+
+from functools import lru_cache
 
 from fasthtml.common import *
 from faststrap import Input, Checkbox, Button, Alert, Icon
 from app.presentation.components.ui.layouts import AuthLayout
 
 
-def LoginForm(error: str | None = None) -> FT:
-    """Login form component.
-    
-    Args:
-        error: Optional error message to display
-    
-    Returns:
-        Form element with email and password fields
-    """
-    return Form(
-        # Error alert
-        Alert(error, variant="danger", dismissible=True) if error else None,
-        
+@lru_cache(maxsize=1)
+def _login_form_fields() -> Safe:
+    """Pre-rendered markup for the invariant part of the login form."""
+    return to_xml((
         # Email field
         Input(
             "email",
@@ -46,6 +43,24 @@ def LoginForm(error: str | None = None) -> FT:
         
         # Submit button
         Button("Login", variant="primary", full_width=True, type="submit"),
+    ))
+
+
+def LoginForm(error: str | None = None) -> FT:
+    """Login form component.
+    
+    Args:
+        error: Optional error message to display
+    
+    Returns:
+        Form element with email and password fields
+    """
+    return Form(
+        # Error alert
+        Alert(error, variant="danger", dismissible=True) if error else None,
+        
+        # Email, password, remember me and submit (static)
+        _login_form_fields(),
         
         method="post",
         action="/login",
@@ -1,21 +1,69 @@
-"""Student Communication (Chat & Calls) components."""
+"""Student Communication (Chat & Calls) components.
+
+Parts of the page that repeat between requests are rendered on first use,
+after component defaults are set, and cached.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple
 
 from fasthtml.common import *
-from faststrap import Card, Button, Icon, Row, Col, Badge, Input, InputGroup
+from faststrap import Card, Button, Icon, Input
+
+
+class ChatMessageItem(NamedTuple):
+    """A chat message as shown in the conversation."""
+    text: str
+    time: str
+    is_me: bool
+
 
+class CallRecord(NamedTuple):
+    """A call history entry."""
+    name: str
+    type: str
+    duration: str
+    time: str
 
-def ChatHeader(supervisor: dict) -> FT:
+
+# Supervisor status classes, keyed by whether the supervisor is online
+_STATUS_DOT_CLS = {
+    True: "chat-status-dot position-absolute bg-success border border-white rounded-circle",
+    False: "chat-status-dot position-absolute bg-secondary border border-white rounded-circle"
+}
+_STATUS_TEXT_CLS = {
+    True: "text-success small fw-bold",
+    False: "text-muted small fw-bold"
+}
+
+
+def ChatHeader(supervisor: dict) -> Safe:
     """Header for the chat interface with supervisor info and actions."""
-    name = supervisor.get("name", "Dr. Ada Williams")
-    dept = supervisor.get("department", "Computer Science")
-    status = supervisor.get("status", "Online")
-    sup_id = supervisor.get("id", "")
+    return _chat_header(*_supervisor_details(supervisor))
+
+
+def _supervisor_details(supervisor: dict) -> tuple:
+    """Supervisor (name, department, status, id) with display defaults."""
+    return (
+        supervisor.get("name", "Dr. Ada Williams"),
+        supervisor.get("department", "Computer Science"),
+        supervisor.get("status", "Online"),
+        supervisor.get("id", "")
+    )
+
+
+@lru_cache(maxsize=64)
+def _chat_header(name: str, dept: str, status: str, sup_id: str) -> Safe:
+    """Rendered markup for the chat header, cached by supervisor details.
     
-    # Generate initials
-    parts = name.split()
-    initials = "".join([p[0] for p in parts[:2]]) if parts else "SU"
+    A student always sees the same supervisor, so the header is rendered
+    once per supervisor rather than on every page load.
+    """
+    # Generate initials from the first two words
+    first, _, rest = name.strip().partition(" ")
+    initials = (first[:1] + rest.lstrip()[:1]) or "SU"
     
-    return Card(
+    return to_xml(Card(
         Div(
             # User Info
             Div(
@@ -23,20 +71,18 @@ def ChatHeader(supervisor: dict) -> FT:
                 Div(
                     Div(
                         initials,
-                        cls="rounded-circle bg-primary-subtle text-primary d-flex align-items-center justify-content-center fw-bold",
-                        style="width: 48px; height: 48px; font-size: 1.2rem;"
+                        cls="chat-avatar rounded-circle bg-primary-subtle text-primary d-flex align-items-center justify-content-center fw-bold"
                     ),
                     # Online status indicator
                     Div(
-                        cls=f"position-absolute {'bg-success' if status == 'Online' else 'bg-secondary'} border border-white rounded-circle",
-                        style="width: 12px; height: 12px; bottom: 0; right: 0;"
+                        cls=_STATUS_DOT_CLS[status == "Online"]
                     ),
                     cls="position-relative me-3"
                 ),
                 Div(
                     H5(name, cls="mb-0 fw-bold"),
                     Div(dept, cls="text-muted small"),
-                    Div(status, cls=f"{'text-success' if status == 'Online' else 'text-muted'} small fw-bold"),
+                    Div(status, cls=_STATUS_TEXT_CLS[status == "Online"]),
                     cls="d-flex flex-column"
                 ),
                 cls="d-flex align-items-center"
@@ -47,8 +93,7 @@ def ChatHeader(supervisor: dict) -> FT:
                 Button(
                     Icon("telephone"),
                     variant="light",
-                    cls="rounded-circle me-2",
-                    style="width: 40px; height: 40px;",
+                    cls="btn-icon-round rounded-circle me-2",
                     title="Start Voice Call",
                     onclick="handleVideoCallClick(event, 'voice')",
                     disabled=not sup_id,
@@ -57,8 +102,7 @@ def ChatHeader(supervisor: dict) -> FT:
                 Button(
                     Icon("camera-video"),
                     variant="primary",
-                    cls="rounded-circle",
-                    style="width: 40px; height: 40px;",
+                    cls="btn-icon-round rounded-circle",
                     title="Start Video Call",
                     onclick="handleVideoCallClick(event)",
                     disabled=not sup_id,
@@ -69,41 +113,58 @@ def ChatHeader(supervisor: dict) -> FT:
             cls="d-flex justify-content-between align-items-center p-3"
         ),
         cls="border-0 shadow-sm mb-3 white-color"
+    ))
+
+
+# Message bubble classes by sender (is_me): own messages sit on the right in
+# primary colour, supervisor messages on the left in light grey.
+# Each entry is (row classes, column classes, bubble classes).
+_BUBBLE_STYLE = {
+    True: (
+        "d-flex justify-content-end mb-3",
+        "d-flex flex-column align-items-end",
+        "chat-bubble p-3 bg-primary text-white rounded-3 rounded-bottom-right-0"
+    ),
+    False: (
+        "d-flex justify-content-start mb-3",
+        "d-flex flex-column align-items-start",
+        "chat-bubble p-3 bg-light text-dark rounded-3 rounded-bottom-left-0"
     )
+}
+_BUBBLE_TIME_CLS = "chat-bubble-time text-muted small mt-1 mx-1"
 
 
 def MessageBubble(text: str, time: str, is_me: bool) -> FT:
     """Individual chat message bubble."""
+    row_cls, col_cls, bubble_cls = _BUBBLE_STYLE[bool(is_me)]
     
-    # Styling based on sender
-    if is_me:
-        # User message (Right, Purple/Primary)
-        align_cls = "justify-content-end"
-        bubble_cls = "bg-primary text-white"
-        radius_cls = "rounded-3 rounded-bottom-right-0"
-    else:
-        # Supervisor message (Left, Gray/Light)
-        align_cls = "justify-content-start"
-        bubble_cls = "bg-light text-dark"
-        radius_cls = "rounded-3 rounded-bottom-left-0"
-        
     return Div(
         Div(
-            Div(
-                text,
-                cls=f"p-3 {bubble_cls} {radius_cls}",
-                style="max-width: 80%; box-shadow: 0 1px 2px rgba(0,0,0,0.05);"
-            ),
-            Div(time, cls="text-muted small mt-1 mx-1", style="font-size: 0.7rem;"),
-            cls="d-flex flex-column" + (" align-items-end" if is_me else " align-items-start")
+            Div(text, cls=bubble_cls),
+            Div(time, cls=_BUBBLE_TIME_CLS),
+            cls=col_cls
         ),
-        cls=f"d-flex {align_cls} mb-3"
+        cls=row_cls
     )
 
 
-def ChatInput(recipient_id: str) -> FT:
-    """Input area for sending messages."""
-    return Card(
+def MessageList(messages: list) -> list:
+    """Message bubbles for a whole conversation.
+    
+    Args:
+        messages: ChatMessageItem records, oldest first
+    """
+    return [MessageBubble(text, time, is_me) for text, time, is_me in messages]
+
+
+@lru_cache(maxsize=1024)
+def ChatInput(recipient_id: str) -> Safe:
+    """Input area for sending messages.
+    
+    Only the recipient varies, so the rendered markup is cached per
+    recipient.
+    """
+    return to_xml(Card(
         Form(
             Div(
                 Button(
@@ -123,8 +184,7 @@ def ChatInput(recipient_id: str) -> FT:
                 Button(
                     Icon("send-fill"),
                     variant="primary",
-                    cls="rounded-circle ms-2 d-flex align-items-center justify-content-center",
-                    style="width: 40px; height: 40px;",
+                    cls="btn-icon-round rounded-circle ms-2 d-flex align-items-center justify-content-center",
                     type="submit"
                 ),
                 cls="d-flex align-items-center p-2 bg-light rounded-pill border"
@@ -132,15 +192,25 @@ def ChatInput(recipient_id: str) -> FT:
             id="chat-form"
         ),
         cls="mt-3 border-0 bg-transparent"
-    )
+    ))
 
 
-def CallHistoryItem(call: dict) -> FT:
+def CallHistoryItem(call: CallRecord) -> Safe:
     """Individual call history item."""
-    icon_color = "text-success" if call["type"] == "incoming" else "text-primary"
-    icon_name = "telephone-inbound-fill" if call["type"] == "incoming" else "telephone-outbound-fill"
+    return _call_history_item(*call)
+
+
+@lru_cache(maxsize=512)
+def _call_history_item(name: str, call_type: str, duration: str, time: str) -> Safe:
+    """Rendered markup for a call history row, cached by its field values.
     
-    return Div(
+    Call rows rarely change between polls, so identical rows are rendered
+    only once.
+    """
+    icon_color = "text-success" if call_type == "incoming" else "text-primary"
+    icon_name = "telephone-inbound-fill" if call_type == "incoming" else "telephone-outbound-fill"
+    
+    return to_xml(Div(
         Div(
             # Call Icon
             Div(
@@ -149,107 +219,160 @@ def CallHistoryItem(call: dict) -> FT:
             ),
             # Call Details
             Div(
-                H6(call["name"], cls="mb-0 fw-bold"),
-                P(f"{call['type'].capitalize()} • {call['duration']}", cls="text-muted small mb-0"),
+                H6(name, cls="mb-0 fw-bold"),
+                P(f"{call_type.capitalize()} • {duration}", cls="text-muted small mb-0"),
                 cls="flex-grow-1"
             ),
             # Time
-            P(call["time"], cls="text-muted small mb-0"),
+            P(time, cls="text-muted small mb-0"),
             cls="d-flex align-items-center"
         ),
         cls="p-3 border-bottom"
-    )
+    ))
 
 
-def CommunicationTabs(active_tab: str = "chat") -> FT:
-    """Communication filter tabs."""
-    return Div(
+# Tab button classes, keyed by whether the tab is active
+_TAB_CLS = {
+    True: "bg-primary text-white",
+    False: "border bg-white text-dark"
+}
+# Attributes shared by both tab buttons
+_TAB_KW = {
+    "hx_target": "#communication-content",
+    "hx_swap": "innerHTML",
+    "style": "border-radius:8px;"
+}
+
+
+@lru_cache(maxsize=8)
+def CommunicationTabs(active_tab: str = "chat") -> Safe:
+    """Communication filter tabs.
+    
+    Rendered markup is cached per active tab.
+    """
+    return to_xml(Div(
         Button(
             "Chat", 
-            cls=f"me-2 {'bg-primary text-white' if active_tab == 'chat' else 'border bg-white text-dark'}",
+            cls="me-2 " + _TAB_CLS[active_tab == "chat"],
             hx_get="/student/communication?tab=chat",
-            hx_target="#communication-content",
-            hx_swap="innerHTML",
-            style="border-radius:8px;"
+            **_TAB_KW
         ),
         Button(
             "Call History", 
-            cls=f"{'bg-primary text-white' if active_tab == 'calls' else 'border bg-white text-dark'}",
+            cls=_TAB_CLS[active_tab == "calls"],
             hx_get="/student/communication?tab=calls",
-            hx_target="#communication-content",
-            hx_swap="innerHTML",
-            style="border-radius:8px;"
+            **_TAB_KW
         ),
         cls="mb-3 d-flex gap-2",
         id="communication-tabs",
         hx_swap_oob="true" if active_tab != "chat" else None
-    )
+    ))
+
+
+# Mock call history (Keep as is for now or todo)
+_MOCK_CALLS = (
+    CallRecord("Dr. Ada Williams", "incoming", "15:32", "2 hours ago"),
+    CallRecord("Dr. Ada Williams", "outgoing", "08:15", "Yesterday"),
+    CallRecord("Dr. Ada Williams", "incoming", "22:45", "2 days ago"),
+)
+
+
+@lru_cache(maxsize=1)
+def _call_history_content() -> Safe:
+    """Rendered markup for the call history tab.
+    
+    The call list is static mock data, so the tab is rendered once.
+    """
+    return to_xml(Div(
+        Card(
+            Div(
+                H5("Call History", cls="mb-3"),
+                *[CallHistoryItem(call) for call in _MOCK_CALLS],
+                cls="p-3"
+            ),
+            cls="white-color"
+        ),
+        id="communication-content"
+    ))
 
 
 def CommunicationContent(active_tab: str = "chat", messages: list = [], recipient_id: str = None) -> FT:
     """Communication content area (chat or call history)."""
     if active_tab == "calls":
-        # Mock call history (Keep as is for now or todo)
-        calls = [
-            {"name": "Dr. Ada Williams", "type": "incoming", "duration": "15:32", "time": "2 hours ago"},
-            {"name": "Dr. Ada Williams", "type": "outgoing", "duration": "08:15", "time": "Yesterday"},
-            {"name": "Dr. Ada Williams", "type": "incoming", "duration": "22:45", "time": "2 days ago"},
-        ]
-        
-        return Div(
-            Card(
+        return _call_history_content()
+    elif not messages:
+        return _empty_chat_content(recipient_id)
+    else:
+        return _chat_content(messages, recipient_id)
+
+
+@lru_cache(maxsize=256)
+def _empty_chat_content(recipient_id: str) -> Safe:
+    """Rendered markup for a chat view with no messages, cached per recipient.
+    
+    HTMX tab switches and new conversations render the chat view without
+    messages, which only varies by recipient.
+    """
+    return to_xml(_chat_content((), recipient_id))
+
+
+def _chat_content(messages, recipient_id: str) -> FT:
+    """Chat view with the message list and input footer."""
+    return Div(
+        Card(
+            Div(
                 Div(
-                    H5("Call History", cls="mb-3"),
-                    *[CallHistoryItem(call) for call in calls],
-                    cls="p-3"
+                    *MessageList(messages),
+                    cls="chat-messages p-4",
+                    id="chat-messages-list",
+                    style="height: 400px; overflow-y: auto;"
                 ),
-                cls="white-color"
-            ),
-            id="communication-content"
-        )
-    else:
-        # Chat view
-        return Div(
-            Card(
+                # Input Footer
                 Div(
-                    Div(
-                        *[
-                            MessageBubble(m["text"], m["time"], m["is_me"]) 
-                            for m in messages
-                        ],
-                        cls="chat-messages p-4",
-                        id="chat-messages-list",
-                        style="height: 400px; overflow-y: auto;"
-                    ),
-                    # Input Footer
-                    Div(
-                        ChatInput(recipient_id),
-                        cls="p-3 border-top"
-                    ),
-                    cls="mb-4 white-color"
+                    ChatInput(recipient_id),
+                    cls="p-3 border-top"
                 ),
-                id="communication-content"
+                cls="mb-4 white-color"
             ),
-            # Auto-scroll on load
-            Script("var list = document.getElementById('chat-messages-list'); if(list) list.scrollTop = list.scrollHeight;")
+            id="communication-content"
         )
+        # Auto-scroll is handled by chat_manager.js (load and htmx swaps)
+    )
 
 
 def CommunicationPage(active_tab: str = "chat", supervisor: dict = None, messages: list = []) -> FT:
     """Main Communication (Chat & Calls) page."""
     if supervisor is None:
         supervisor = {}
-        
+    
+    details = _supervisor_details(supervisor)
+    if active_tab == "calls" or not messages:
+        return _static_communication_page(active_tab, details, supervisor.get("id"))
+    
+    return _communication_page(active_tab, details, messages, supervisor.get("id"))
+
+
+@lru_cache(maxsize=256)
+def _static_communication_page(active_tab: str, details: tuple, recipient_id: str) -> Safe:
+    """Rendered markup for a communication page without chat messages.
+    
+    The call history tab and an empty chat depend only on the tab and the
+    supervisor, so the whole page is rendered once per combination.
+    """
+    return to_xml(_communication_page(active_tab, details, (), recipient_id))
+
+
+def _communication_page(active_tab: str, details: tuple, messages, recipient_id: str) -> FT:
+    """Communication page body for the given supervisor details."""
     return Div(
         # 1. Supervisor Details (Header)
-        ChatHeader(supervisor),
+        _chat_header(*details),
         
         # 2. Filter Tabs
         CommunicationTabs(active_tab),
         
         # 3. Content Area (Chat or Call History)
-        CommunicationContent(active_tab, messages, supervisor.get("id")),
+        CommunicationContent(active_tab, messages, recipient_id),
         
         cls="h-100"
     )
-
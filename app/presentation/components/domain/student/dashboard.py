@@ -1,8 +1,15 @@
-"""Student dashboard components - Simplified working version."""
+"""Student dashboard components - Simplified working version.
+
+Static cards, and the main content per student and day, are rendered on
+first use, after component defaults are set, and cached.
+"""
+
+from functools import lru_cache
 
 from fasthtml.common import *
 from faststrap import Card, Row, Col, Progress, Badge, Icon, Button
-from datetime import datetime
+from datetime import date
+from app.presentation.components.shared.icons import icon_markup
 from app.presentation.components.ui.badges import StatusBadge
 from app.presentation.components.ui.layouts import DashboardLayout
 from app.presentation.components.ui.navigation import StudentSidebarNav, StudentBottomNav
@@ -36,6 +43,102 @@ def RecentActivityCard() -> FT:
         )
 
 
+@lru_cache(maxsize=1)
+def _date_label(day: date) -> str:
+    """Long date label, e.g. "March 04, 2026"; changes once a day."""
+    return day.strftime("%B %d, %Y")
+
+
+@lru_cache(maxsize=1)
+def _recent_activity_item() -> Safe:
+    """Rendered markup for the (static) recent activity entry."""
+    return to_xml(RecentActivityCard())
+
+
+@lru_cache(maxsize=1)
+def _location_card() -> Safe:
+    """Rendered markup for the location accuracy card (static)."""
+    return to_xml(Card(
+        Div(
+            Div(
+                H6("Location Accuracy", cls="mb-0"),
+                Span(
+                    "94% within geofence",
+                    style="font-size:12px; background-color: #E7F7F2; border-radius: 20px; padding: 4px 8px; color: #10B77F;"
+                        ),
+                
+                cls="d-flex justify-content-between align-items-center mb-3"
+            ),
+            # Progress(
+            #     94,
+            #     variant="primary",
+            #     height="12px",
+            # ),
+            Div(
+                Progress(
+                    80,
+                    variant="primary",
+                    height="8px",
+                    cls="mb-3 w-100"
+                ),
+                Icon("activity", cls="text-success"),
+                cls="d-flex align-items-center gap-2 w-90 justify-content-between"
+            ),
+        ),
+        cls="mb-4"
+    ))
+
+
+@lru_cache(maxsize=1)
+def _activity_card() -> Safe:
+    """Rendered markup for the recent activity card (static)."""
+    return to_xml(Card(
+        Div(
+            Div(
+                H6("Recent Activity", cls="mb-0"),
+                A("View all", href="/student/logbook", cls="text-decoration-none small"),
+                cls="d-flex justify-content-between align-items-center mb-3"
+            ),
+            Col(
+                *(_recent_activity_item(),) * 5,
+                cls="activity-list"
+            )
+        )
+    ))
+
+
+# Stats cards: (icon, label, icon classes)
+_STAT_SPECS = (
+    ("check-circle", "Verified", "stat-icon stat-icon-verified"),
+    ("clock", "Pending", "stat-icon stat-icon-pending"),
+    ("exclamation-circle", "Flagged", "stat-icon stat-icon-flagged"),
+    ("hourglass-split", "Hours", "stat-icon stat-icon-hours"),
+)
+
+
+def _stat_col(spec: tuple, value: int) -> FT:
+    """Stats card column for one dashboard count."""
+    icon, label, icon_cls = spec
+    return Col(
+        Card(
+            Div(
+                Div(
+                    icon_markup(icon, "fs-5 mb-2"),
+                    cls=icon_cls
+                ),
+                Div(
+                    H3(str(value), cls="mb-0"),
+                    P(label, cls="text-muted small mb-0"),
+                    cls="text-left"
+                ),
+                cls="d-flex align-items-center w-100 h-100 gap-3"
+            ),
+            cls="h-100"
+        ),
+        md=3, sm=6, cls="mb-3"
+    )
+
+
 def StudentDashboard(user_name: str, current_week: int = 5, verified: int = 3, pending: int = 3, flagged: int = 0, hours: int = 46) -> FT:
     """Complete student dashboard.
     
@@ -50,7 +153,29 @@ def StudentDashboard(user_name: str, current_week: int = 5, verified: int = 3, p
     Returns:
         Complete dashboard HTML with layout
     """
+    return DashboardLayout(
+        _dashboard_content(user_name, current_week, verified, pending, flagged, hours, date.today()),
+        sidebar=StudentSidebarNav(active_page="dashboard"),
+        bottom_nav=StudentBottomNav(active_page="dashboard")
+    )
+
+
+@lru_cache(maxsize=256)
+def _dashboard_content(
+    user_name: str,
+    current_week: int,
+    verified: int,
+    pending: int,
+    flagged: int,
+    hours: int,
+    today: date
+) -> Safe:
+    """Rendered markup for the dashboard's main content.
     
+    Everything shown depends only on the arguments (``today`` drives the
+    date label), so each student's content is rendered once per day until
+    their figures change.
+    """
     # Header with greeting
     header = Div(
         Div(
@@ -59,7 +184,7 @@ def StudentDashboard(user_name: str, current_week: int = 5, verified: int = 3, p
             cls="flex-grow-1"
         ),
         Button(
-            Icon("plus-lg", cls="me-2"),
+            icon_markup("plus-lg", "me-2"),
             "Create Log",
             variant="primary",
             as_="a",
@@ -74,11 +199,11 @@ def StudentDashboard(user_name: str, current_week: int = 5, verified: int = 3, p
         Div(
             # Week info
             Div(
-                Icon("calendar-week", cls="text-primary me-2"),
+                icon_markup("calendar-week", "text-primary me-2"),
                 f"Week {current_week} of 25",
                 cls="d-flex align-items-center mb-2"
             ),
-            P(datetime.now().strftime("%B %d, %Y"), cls="text-muted small mb-3"),
+            P(_date_label(today), cls="text-muted small mb-3"),
             
             # Progress bar
             Progress(
@@ -117,137 +242,20 @@ def StudentDashboard(user_name: str, current_week: int = 5, verified: int = 3, p
     
     # Stats cards
     stats_cards = Row(
-        Col(
-            Card(
-                Div(
-                    Div(
-                        Icon("check-circle", cls="fs-5 mb-2"),
-                        style="background-color: #E7F7F2; border-radius: 10px; padding: 5px 10px; color: #10B77F;"
-                        ),
-                    Div(
-                        H3(str(verified), cls="mb-0"),
-                        P("Verified", cls="text-muted small mb-0"),
-                        cls="text-left"
-                    ),
-                    cls="d-flex align-items-center w-100 h-100 gap-3"
-                ),
-                cls="h-100"
-            ),
-            md=3, sm=6, cls="mb-3"
-        ),
-        Col(
-            Card(
-                Div(
-                    Div(
-                        Icon("clock", cls="fs-5 mb-2"),
-                        style="background-color: #FDF5E6; border-radius: 10px; padding: 5px 10px; color: #F8C468;"
-                        ),
-                    Div(
-                        H3(str(pending), cls="mb-0"),
-                        P("Pending", cls="text-muted small mb-0"),
-                        cls="text-left"
-                    ),
-                    cls="d-flex align-items-center w-100 h-100 gap-3"
-                ),
-                cls="h-100"
-            ),
-            md=3, sm=6, cls="mb-3"
-        ),
-        Col(
-            Card(
-                Div(
-                    Div(
-                        Icon("exclamation-circle", cls="fs-5 mb-2"),
-                        style="background-color: #FDECEC; border-radius: 10px; padding: 5px 10px; color: #EF4343;"
-                        ),
-                    Div(
-                        H3(str(flagged), cls="mb-0"),
-                        P("Flagged", cls="text-muted small mb-0"),
-                        cls="text-left"
-                    ),
-                    cls="d-flex align-items-center w-100 h-100 gap-3"
-                ),
-                cls="h-100"
-            ),
-            md=3, sm=6, cls="mb-3"
-        ),
-        Col(
-            Card(
-                Div(
-                    Div(
-                        Icon("hourglass-split", cls="fs-5 mb-2"),
-                        style="background-color: #EBF2FE; border-radius: 10px; padding: 5px 10px; color: #3C83F6;"
-                        ),
-                    Div(
-                        H3(str(hours), cls="mb-0"),
-                        P("Hours", cls="text-muted small mb-0"),
-                        cls="text-left"
-                    ),
-                    cls="d-flex align-items-center w-100 h-100 gap-3"
-                ),
-                cls="h-100"
-            ),
-            md=3, sm=6, cls="mb-3"
-        ),
+        *[
+            _stat_col(spec, value)
+            for spec, value in zip(_STAT_SPECS, (verified, pending, flagged, hours))
+        ],
         cls="g-3",
         cols=2,
         cols_md=3,
         cols_lg=4,
     )
     
-    # Location accuracy card
-    location_card = Card(
-        Div(
-            Div(
-                H6("Location Accuracy", cls="mb-0"),
-                Span(
-                    "94% within geofence",
-                    style="font-size:12px; background-color: #E7F7F2; border-radius: 20px; padding: 4px 8px; color: #10B77F;"
-                        ),
-                
-                cls="d-flex justify-content-between align-items-center mb-3"
-            ),
-            # Progress(
-            #     94,
-            #     variant="primary",
-            #     height="12px",
-            # ),
-            Div(
-                Progress(
-                    80,
-                    variant="primary",
-                    height="8px",
-                    cls="mb-3 w-100"
-                ),
-                Icon("activity", cls="text-success"),
-                cls="d-flex align-items-center gap-2 w-90 justify-content-between"
-            ),
-        ),
-        cls="mb-4"
-    )
-    
-    # Recent activity card
-    activity_card = Card(
-        Div(
-            Div(
-                H6("Recent Activity", cls="mb-0"),
-                A("View all", href="/student/logbook", cls="text-decoration-none small"),
-                cls="d-flex justify-content-between align-items-center mb-3"
-            ),
-            Col(
-                *[RecentActivityCard() for _ in range(5)],
-                cls="activity-list"
-            )
-        )
-    )
-    
-    # Return complete page with layout
-    return DashboardLayout(
+    return to_xml((
         header,
         week_card,
         stats_cards,
-        location_card,
-        activity_card,
-        sidebar=StudentSidebarNav(active_page="dashboard"),
-        bottom_nav=StudentBottomNav(active_page="dashboard")
-    )
+        _location_card(),
+        _activity_card()
+    ))
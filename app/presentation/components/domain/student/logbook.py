@@ -1,4 +1,10 @@
-"""Student logbook components - Daily log tracking with 25-week overview."""
+"""Student logbook components - Daily log tracking with 25-week overview.
+
+Filter tabs, day cells and week cards are rendered on first use, after
+component defaults are set, and cached by their values.
+"""
+
+from functools import lru_cache
 
 from fasthtml.common import *
 from faststrap import Card, Button, Icon, Alert, Input, Badge, Modal, Row, Col
@@ -6,14 +12,17 @@ from datetime import datetime, timedelta
 from typing import List, Dict
 
 
-def FilterTabs(active_filter: str = "all", oob: bool = False) -> FT:
+@lru_cache(maxsize=8)
+def FilterTabs(active_filter: str = "all", oob: bool = False) -> Safe:
     """Filter tabs for logbook view.
     
+    Only a handful of (active_filter, oob) combinations exist, so each is
+    rendered once and reused.
+    
     Args:
         active_filter: Current active filter (all, this_week, pending)
         oob: Whether to return as Out-Of-Band swap
     
-        
     Returns:
         Filter tabs HTML
     """
@@ -23,7 +32,7 @@ def FilterTabs(active_filter: str = "all", oob: bool = False) -> FT:
         {"key": "pending", "label": "Pending Review"},
     ]
     
-    return Div(
+    return to_xml(Div(
         *[
             Button(
                 f["label"],
@@ -38,12 +47,16 @@ def FilterTabs(active_filter: str = "all", oob: bool = False) -> FT:
         cls="mb-4 d-flex flex-wrap gap-2",
         id="student-filter-tabs",
         hx_swap_oob="true" if oob else None
-    )
+    ))
 
 
-def DayCell(day_name: str, display_date: str, iso_date: str, status: str | None = None, hours: int | None = None) -> FT:
+@lru_cache(maxsize=4096)
+def DayCell(day_name: str, display_date: str, iso_date: str, status: str | None = None, hours: int | None = None) -> Safe:
     """Individual day cell in week card.
     
+    The rendered markup is cached by the cell's values, so unchanged days
+    are not rebuilt on every logbook render.
+    
     Args:
         day_name: Day of week (Mon, Tue, etc.)
         display_date: Date string for display (e.g., "Jan 15")
@@ -71,7 +84,7 @@ def DayCell(day_name: str, display_date: str, iso_date: str, status: str | None
     elif status == "flagged": icon_key = "flagged"
     elif status == "pending_review": icon_key = "pending"
     
-    return A(
+    return to_xml(A(
         Div(
             Div(
                 Div(day_name, cls="fw-bold"),
@@ -89,14 +102,15 @@ def DayCell(day_name: str, display_date: str, iso_date: str, status: str | None
         hx_target="#modal-body-content",
         hx_swap="innerHTML",
         cls="text-decoration-none"
-    )
+    ))
 
-def DayCellNormal(day_name: str, display_date: str, iso_date: str, status: str | None = None) -> FT:
-    """Individual day cell in week card (simplified)."""
+@lru_cache(maxsize=4096)
+def DayCellNormal(day_name: str, display_date: str, iso_date: str, status: str | None = None) -> Safe:
+    """Individual day cell in week card (simplified, cached like DayCell)."""
     cell_class = f"day-cell day-cell-{status}" if status else "day-cell day-cell-pending"
     if status == "pending_review": cell_class = "day-cell day-cell-pending"
     
-    return A(
+    return to_xml(A(
         Div(
             Div(day_name, cls="fw-bold"),
             cls=f"{cell_class} black-color justify-content-center align-items-center w-100",
@@ -107,20 +121,35 @@ def DayCellNormal(day_name: str, display_date: str, iso_date: str, status: str |
         hx_target="#modal-body-content",
         hx_swap="innerHTML",
         cls="text-decoration-none"
-    )
+    ))
 
 
-def WeekCard(week_number: int, start_date: datetime, days_data: List[Dict]) -> FT:
+def WeekCard(week_number: int, start_date: datetime, days_data: List[Dict]) -> Safe:
     """Week card showing 5 daily cells."""
+    days = tuple(
+        (day["name"], day["display_date"], day["iso_date"], day.get("status"))
+        for day in days_data
+    )
+    return _week_card(week_number, start_date, days)
+
+
+@lru_cache(maxsize=1024)
+def _week_card(week_number: int, start_date: datetime, days: tuple) -> Safe:
+    """Rendered markup for a week card, cached by its week and day values.
+    
+    A week's markup only changes when one of its days changes status, so
+    no explicit invalidation is needed when logs are written.
+    """
     end_date = start_date + timedelta(days=4)
     date_range = f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d, %Y')}"
     
     # Calculate status counts
-    verified = sum(1 for d in days_data if d.get("status") == "verified")
-    pending = sum(1 for d in days_data if d.get("status") in ["pending", "pending_review"])
-    flagged = sum(1 for d in days_data if d.get("status") == "flagged")
+    statuses = [status for *_, status in days]
+    verified = statuses.count("verified")
+    pending = statuses.count("pending") + statuses.count("pending_review")
+    flagged = statuses.count("flagged")
     
-    return Card(
+    return to_xml(Card(
         # Header
         Div(
             Div(
@@ -139,56 +168,31 @@ def WeekCard(week_number: int, start_date: datetime, days_data: List[Dict]) -> F
         
         # Daily grid
         Div(
-            *[
-                DayCellNormal(
-                    day["name"],
-                    day["display_date"],
-                    day["iso_date"],
-                    day.get("status")
-                )
-                for day in days_data
-            ],
+            Safe("".join([DayCellNormal(*day) for day in days])),
             cls="daily-grid m-1"
         ),
         
         cls="week-card white-color"
-    )
-
-# GPS Capture JavaScript
-GPS_CAPTURE_SCRIPT = """
-if (navigator.geolocation) {
-    navigator.geolocation.getCurrentPosition(
-        (position) => {
-            document.getElementById('latitude').value = position.coords.latitude;
-            document.getElementById('longitude').value = position.coords.longitude;
-            document.getElementById('gps-coords').textContent = 
-                position.coords.latitude.toFixed(6) + ', ' + position.coords.longitude.toFixed(6);
-            document.getElementById('gps-status').textContent = 'Location acquired ✓';
-            document.getElementById('gps-alert').className = 'alert alert-success';
-            document.getElementById('submit-btn').disabled = false;
-        },
-        (error) => {
-            document.getElementById('gps-status').textContent = 'Location required - Please enable GPS';
-            document.getElementById('gps-alert').className = 'alert alert-danger';
-        }
-    );
-} else {
-    document.getElementById('gps-status').textContent = 'GPS not supported';
-    document.getElementById('gps-alert').className = 'alert alert-danger';
-}
+    ))
 
-// Character counter
-const textarea = document.querySelector('textarea[name="activity_description"]');
-const charCount = document.getElementById('char-count');
-if (textarea && charCount) {
-    textarea.addEventListener('input', () => {
-        charCount.textContent = textarea.value.length;
-    });
-}
-"""
+def WeekCards(weeks_data: List[Dict]) -> Safe:
+    """Week cards for the weeks container, joined into a single markup block.
+    
+    Each card is already cached markup, so the cards are concatenated
+    directly instead of being wrapped as separate child elements.
+    """
+    return Safe("".join([
+        WeekCard(week["number"], week["start_date"], week["days"])
+        for week in weeks_data
+    ]))
 
 def LogEntryModalBody(date: str, existing_log: Dict | None = None) -> FT:
     """Modal body content.
+    
+    GPS capture and offline submission are handled by
+    /assets/logbook_modal.js, which initializes the form after htmx swaps
+    it into the modal.
+    
     Args:
         date: ISO date string (YYYY-MM-DD)
     """
@@ -269,58 +273,10 @@ def LogEntryModalBody(date: str, existing_log: Dict | None = None) -> FT:
                 cls="d-flex justify-content-end"
             ),
             
-            # Offline/Sync submission script
-            Script("""
-                const form = document.currentScript.parentElement;
-                form.addEventListener('submit', async (e) => {
-                    e.preventDefault();
-                    
-                    const submitBtn = document.getElementById('submit-btn');
-                    const originalText = submitBtn.textContent;
-                    submitBtn.disabled = true;
-                    submitBtn.textContent = 'Saving...';
-                    
-                    try {
-                        // Gather data
-                        const formData = new FormData(form);
-                        const data = Object.fromEntries(formData.entries());
-                        
-                        // Save specific types
-                        data.week_number = '""" + str(existing_log.get('week_number', 0) if existing_log else 0) + """'; 
-                        
-                        // Save to IndexedDB via SyncManager
-                        if (window.syncManager) {
-                            await window.syncManager.saveLog(data);
-                            console.log("Saved to IndexedDB");
-                            
-                            // Try sync if online
-                            if (navigator.onLine) {
-                                await window.syncManager.syncWithServer();
-                            } else {
-                                alert("Saved offline. Will sync when online.");
-                            }
-                        } else {
-                            // Fallback if sync manager missing (shouldn't happen)
-                            alert("Sync manager not loaded!");
-                        }
-                        
-                        // Reload to show updates (served from DB or local)
-                        window.location.reload();
-                        
-                    } catch (err) {
-                        console.error("Save error:", err);
-                        alert("Error saving log: " + err.message);
-                        submitBtn.disabled = false;
-                        submitBtn.textContent = originalText;
-                    }
-                });
-            """),
-            
-            # GPS capture script
-            Script(GPS_CAPTURE_SCRIPT) if not existing_log else "",
-            
             method="post",
-            action="/student/logbook/create"
+            action="/student/logbook/create",
+            # Read by logbook_modal.js when the entry is saved
+            data_week_number=existing_log.get('week_number', 0) if existing_log else 0
         ),
         
         id="modal-body-content"
@@ -382,7 +338,7 @@ def LogbookPage(weeks_data: List[Dict], current_week: int, total_weeks: int = 25
                 cls="d-flex align-items-center justify-content-between"
             ),
             Div(
-                *[
+                Safe("".join([
                     DayCell(
                         day["name"],
                         day["display_date"],
@@ -391,7 +347,7 @@ def LogbookPage(weeks_data: List[Dict], current_week: int, total_weeks: int = 25
                         day.get("hours")
                     )
                     for day in (weeks_data[0]["days"] if weeks_data else [])
-                ],
+                ])),
                 cls="daily-grid"
             ),
 
@@ -402,7 +358,7 @@ def LogbookPage(weeks_data: List[Dict], current_week: int, total_weeks: int = 25
 
         # Weeks container
         Div(
-            *[WeekCard(week["number"], week["start_date"], week["days"]) for week in weeks_data],
+            WeekCards(weeks_data),
             id="weeks-container",
         ),
         
@@ -1,12 +1,20 @@
-"""Student Profile components."""
+"""Student Profile components.
+
+The profile cards depend only on their arguments, so each card's markup is
+rendered once per set of values (on first use, after component defaults
+are set) and cached.
+"""
+
+from functools import lru_cache
 
 from fasthtml.common import *
 from faststrap import Card, Button, Icon, Row, Col, Badge, Switch, Progress, ProgressBar
 
 
-def ProfileHeader(user_name: str, email: str, matric_no: str, department: str) -> FT:
+@lru_cache(maxsize=256)
+def ProfileHeader(user_name: str, email: str, matric_no: str, department: str) -> Safe:
     """Header card with user avatar and basic info."""
-    return Card(
+    return to_xml(Card(
         Div(
             # Avatar
             Div(
@@ -28,7 +36,7 @@ def ProfileHeader(user_name: str, email: str, matric_no: str, department: str) -
             cls="d-flex align-items-center p-2"
         ),
         cls="mb-4 white-color border-0 shadow-sm"
-    )
+    ))
 
 
 def InfoItem(label: str, value: str) -> FT:
@@ -40,14 +48,15 @@ def InfoItem(label: str, value: str) -> FT:
     )
 
 
+@lru_cache(maxsize=256)
 def PersonalInfoCard(
     full_name: str,
     matric_no: str,
     department: str,
     institution: str
-) -> FT:
+) -> Safe:
     """Card showing personal information."""
-    return Card(
+    return to_xml(Card(
         H5(
             Icon("person", cls="me-2 text-primary"),
             "Personal Information", 
@@ -60,17 +69,18 @@ def PersonalInfoCard(
             Col(InfoItem("Institution", institution), xs=12, md=6, cls="mb-3"),
         ),
         cls="mb-4 white-color border-0 shadow-sm"
-    )
+    ))
 
 
+@lru_cache(maxsize=256)
 def PlacementDetailsCard(
     company_name: str,
     address: str,
     supervisor: str,
     radius: str
-) -> FT:
+) -> Safe:
     """Card showing placement details."""
-    return Card(
+    return to_xml(Card(
         H5(
             Icon("building", cls="me-2 text-primary"),
             "Placement Details", 
@@ -107,12 +117,13 @@ def PlacementDetailsCard(
             ),
         ),
         cls="mb-4 white-color border-0 shadow-sm"
-    )
+    ))
 
 
-def DurationCard(start_date: str, end_date: str, weeks: int, months: int) -> FT:
+@lru_cache(maxsize=256)
+def DurationCard(start_date: str, end_date: str, weeks: int, months: int) -> Safe:
     """Card showing SIWES duration and dates."""
-    return Card(
+    return to_xml(Card(
         H5(
             Icon("calendar-event", cls="me-2 text-primary"),
             "SIWES Duration", 
@@ -141,12 +152,13 @@ def DurationCard(start_date: str, end_date: str, weeks: int, months: int) -> FT:
             cls="p-2 bg-light rounded-3 mt-2 text-center"
         ),
         cls="mb-4 white-color border-0 shadow-sm"
-    )
+    ))
 
 
-def SettingsCard() -> FT:
+@lru_cache(maxsize=1)
+def SettingsCard() -> Safe:
     """Settings card with switches."""
-    return Card(
+    return to_xml(Card(
         H5(
             Icon("gear", cls="me-2 text-primary"),
             "Settings", 
@@ -204,7 +216,7 @@ def SettingsCard() -> FT:
             cls="mt-4 d-flex justify-content-end" # Aligned right
         ),
         cls="mb-4 white-color border-0 shadow-sm"
-    )
+    ))
 
 
 def StudentProfilePage(user: dict = None, placement: dict = None) -> FT:
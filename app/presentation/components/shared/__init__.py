@@ -1,6 +1,7 @@
 """Shared utilities and theme configuration."""
 
 from .theme import SIWES_THEME, setup_siwes_defaults
-from .icons import ICON_MAP
+from .icons import ICON_MAP, icon_markup
+from .formatting import time_label
 
-__all__ = ["SIWES_THEME", "setup_siwes_defaults", "ICON_MAP"]
+__all__ = ["SIWES_THEME", "setup_siwes_defaults", "ICON_MAP", "icon_markup", "time_label"]
@@ -0,0 +1,22 @@
+"""Display formatting helpers shared by pages and API responses."""
+
+from datetime import datetime
+
+# Chat timestamps only show the hour and minute ("09:05 AM"), so every label
+# is formatted once here and looked up by minute of the day
+_TIME_LABELS = tuple(
+    datetime(2000, 1, 1, minute // 60, minute % 60).strftime("%I:%M %p")
+    for minute in range(24 * 60)
+)
+
+
+def time_label(moment: datetime) -> str:
+    """Format a timestamp's time of day for display, e.g. "09:05 AM".
+    
+    Args:
+        moment: The timestamp to format
+    
+    Returns:
+        The time formatted as ``%I:%M %p``
+    """
+    return _TIME_LABELS[moment.hour * 60 + moment.minute]
@@ -4,6 +4,11 @@ Maps semantic names to Bootstrap Icons for consistent icon usage
 throughout the application.
 """
 
+from functools import lru_cache
+
+from fasthtml.common import Safe, to_xml
+from faststrap import Icon
+
 # Bootstrap Icons mapping
 ICON_MAP = {
     # Navigation
@@ -76,3 +81,24 @@ def get_icon(name: str) -> str:
         'speedometer2'
     """
     return ICON_MAP.get(name, "question-circle")
+
+
+@lru_cache(maxsize=128)
+def icon_markup(name: str, cls: str = "") -> Safe:
+    """Get the rendered markup for a Bootstrap Icon.
+    
+    Icons are rendered once per name and class combination, so components
+    on hot paths can reuse the markup instead of building a new element.
+    
+    Args:
+        name: Bootstrap Icon name (e.g., 'check-circle')
+        cls: Additional CSS classes for the icon
+    
+    Returns:
+        The icon's HTML markup
+    
+    Example:
+        >>> icon_markup('clock', 'fs-5 mb-2')
+        '<i class="bi bi-clock fs-5 mb-2"></i>'
+    """
+    return to_xml(Icon(name, cls=cls))
@@ -1,19 +1,24 @@
 """Call notification modal component."""
 
+from functools import lru_cache
+
 from fasthtml.common import *
 from faststrap import Card, Button, Icon
 
 
-def CallNotificationModal() -> FT:
+@lru_cache(maxsize=1)
+def CallNotificationModal() -> Safe:
     """Modal that appears when receiving an incoming call.
     
     This modal is hidden by default and shown via JavaScript when
     an SSE 'call_incoming' event is received.
     
+    The modal is static, so its markup is rendered once and cached.
+    
     Returns:
         Modal component with call details and Accept/Decline buttons
     """
-    return Div(
+    return to_xml(Div(
         # Backdrop
         Div(
             id="call-notification-backdrop",
@@ -96,4 +101,4 @@ def CallNotificationModal() -> FT:
             style="display: none;",
             **{"aria-hidden": "true"}
         )
-    )
+    ))
@@ -1,10 +1,17 @@
-"""Navigation components for student and supervisor interfaces."""
+"""Navigation components for student and supervisor interfaces.
+
+Navigation markup depends only on the active page, so each variant is
+rendered once (on first use, after component defaults are set) and cached.
+"""
+
+from functools import lru_cache
 
 from fasthtml.common import *
 from faststrap import Icon
 
 
-def StudentSidebarNav(active_page: str = "dashboard") -> FT:
+@lru_cache(maxsize=16)
+def StudentSidebarNav(active_page: str = "dashboard") -> Safe:
     """Student sidebar navigation - responsive for all screen sizes.
     
     Uses Bootstrap offcanvas for mobile, fixed sidebar for desktop.
@@ -22,7 +29,7 @@ def StudentSidebarNav(active_page: str = "dashboard") -> FT:
         {"icon": "person-fill", "label": "Profile", "href": "/student/profile", "key": "profile"},
     ]
     
-    return Div(
+    return to_xml(Div(
         # Header
         # Div(
         #     Icon("mortarboard-fill", cls="me-2"),
@@ -90,10 +97,11 @@ def StudentSidebarNav(active_page: str = "dashboard") -> FT:
         style="width: 280px; min-height: 100vh; z-index: 1040;",
         id="sidebar",
         tabindex="-1"
-    )
+    ))
 
 
-def StudentBottomNav(active_page: str = "dashboard") -> FT:
+@lru_cache(maxsize=16)
+def StudentBottomNav(active_page: str = "dashboard") -> Safe:
     """Student bottom navigation (mobile only).
     
     Args:
@@ -107,7 +115,7 @@ def StudentBottomNav(active_page: str = "dashboard") -> FT:
         {"icon": "journal-text", "label": "Logbook", "href": "/student/logbook", "key": "logbook"},
     ]
     
-    return Div(
+    return to_xml(Div(
         Div(
             *[
                 A(
@@ -129,10 +137,11 @@ def StudentBottomNav(active_page: str = "dashboard") -> FT:
             cls="d-flex justify-content-around align-items-center w-100"
         ),
         cls="mobile-nav"
-    )
+    ))
 
 
-def SupervisorSidebarNav(active_page: str = "dashboard") -> FT:
+@lru_cache(maxsize=16)
+def SupervisorSidebarNav(active_page: str = "dashboard") -> Safe:
     """Supervisor sidebar navigation - responsive for all screen sizes.
     
     Args:
@@ -148,7 +157,7 @@ def SupervisorSidebarNav(active_page: str = "dashboard") -> FT:
         {"icon": "chat-dots-fill", "label": "Chat & Calls", "href": "/supervisor/communication", "key": "communication"},
     ]
     
-    return Div(
+    return to_xml(Div(
         # Header
         # Div(
         #     Icon("mortarboard-fill", cls="me-2"),
@@ -199,10 +208,11 @@ def SupervisorSidebarNav(active_page: str = "dashboard") -> FT:
         style="width: 280px; min-height: 100vh; z-index: 1040;",
         id="sidebar",
         tabindex="-1"
-    )
+    ))
 
 
-def SupervisorBottomNav(active_page: str = "dashboard") -> FT:
+@lru_cache(maxsize=16)
+def SupervisorBottomNav(active_page: str = "dashboard") -> Safe:
     """Bottom navigation for supervisor on mobile devices.
     
     Args:
@@ -218,7 +228,7 @@ def SupervisorBottomNav(active_page: str = "dashboard") -> FT:
         {"icon": "chat-dots-fill", "label": "Chat", "href": "/supervisor/communication", "key": "communication"},
     ]
     
-    return Div(
+    return to_xml(Div(
         # Bottom nav
         Div(
             *[
@@ -242,4 +252,4 @@ def SupervisorBottomNav(active_page: str = "dashboard") -> FT:
             cls="mobile-nav",
             id="mobile-nav"
         )
-    )
+    ))
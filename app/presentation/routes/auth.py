@@ -68,12 +68,15 @@ def setup_auth_routes(app: FastHTML):
         
         try:
             auth_service = AuthService(db)
-            result = auth_service.login(email, password)
+            result = await auth_service.alogin(email, password)
             
-            # Set session data
+            # Persist last_login_at and any password rehash
+            db.commit()
+            
+            # Set session data (kept minimal: the cookie is re-verified
+            # on every request; other user fields are loaded from the DB)
             request.session["user_id"] = result["user"].id
             request.session["role"] = result["user"].role.value
-            request.session["email"] = result["user"].email
             
             # Set session expiry based on remember_me
             if remember_me:
@@ -10,6 +10,7 @@ from datetime import datetime
 
 from app.infrastructure.security.session import require_auth, require_role
 from app.application.services.daily import DailyService
+from app.domain.models.base import parse_guid
 from app.domain.models.call import CallLog
 from app.domain.models.user import UserRole
 
@@ -116,6 +117,16 @@ def register_call_routes(app):
                         status_code=400,
                         headers={"Content-Type": "application/json"}
                     )
+            
+            # Ids are native UUIDs on PostgreSQL; reject malformed ones here
+            student_id = parse_guid(student_id)
+            supervisor_id = parse_guid(supervisor_id)
+            if student_id is None or supervisor_id is None:
+                return JSONResponse(
+                    {"error": "Invalid student_id or supervisor_id"},
+                    status_code=400,
+                    headers={"Content-Type": "application/json"}
+                )
 
             # Create Daily.co room
             daily_service = DailyService()
@@ -210,7 +221,10 @@ def register_call_routes(app):
             JSON response with redirect URL
         """
         # Get call log
-        call_log = db.query(CallLog).filter(CallLog.id == call_id).first()
+        call_id = parse_guid(call_id)
+        call_log = None
+        if call_id:
+            call_log = db.query(CallLog).filter(CallLog.id == call_id).first()
         
         if not call_log:
             return JSONResponse({"error": "Call not found"}, status_code=404)
@@ -268,7 +282,10 @@ def register_call_routes(app):
             JSON response with success status
         """
         # Get call log
-        call_log = db.query(CallLog).filter(CallLog.id == call_id).first()
+        call_id = parse_guid(call_id)
+        call_log = None
+        if call_id:
+            call_log = db.query(CallLog).filter(CallLog.id == call_id).first()
         
         if not call_log:
             return JSONResponse({"error": "Call not found"}, status_code=404)
@@ -446,7 +463,10 @@ def register_call_routes(app):
             JSON response with success status
         """
         # Get call log
-        call_log = db.query(CallLog).filter(CallLog.id == call_id).first()
+        call_id = parse_guid(call_id)
+        call_log = None
+        if call_id:
+            call_log = db.query(CallLog).filter(CallLog.id == call_id).first()
         
         if not call_log:
             return JSONResponse({"error": "Call not found"}, status_code=404)
@@ -5,9 +5,12 @@ from datetime import datetime
 
 from app.infrastructure.security.session import require_auth
 from app.domain.models.chat import ChatMessage
+from app.domain.models.base import parse_guid
 from app.domain.models.user import User
+from app.infrastructure.repositories.chat import ChatRepository
 from app.application.services.notifications import notification_manager
 from app.infrastructure.database.connection import get_db
+from app.presentation.components.shared.formatting import time_label
 
 def register_chat_routes(app):
     """Register chat-related routes."""
@@ -20,6 +23,10 @@ def register_chat_routes(app):
         current_user = None
     ):
         """Fetch chat history with a specific user."""
+        other_user_id = parse_guid(other_user_id)
+        if other_user_id is None:
+            return []
+        
         db = request.state.db if hasattr(request.state, 'db') else None
         if not db:
             from app.infrastructure.database.connection import SessionLocal
@@ -36,7 +43,7 @@ def register_chat_routes(app):
             {
                 "id": m.id,
                 "text": m.message_body,
-                "time": m.created_at.strftime("%I:%M %p"),
+                "time": time_label(m.created_at),
                 "is_me": m.sender_id == current_user.id,
                 "created_at": m.created_at.isoformat()
             }
@@ -86,16 +93,20 @@ def register_chat_routes(app):
             if not recipient_id or not content:
                 print(f"Missing fields. Recipient: {recipient_id}, Content: {content}")
                 return JSONResponse({"error": "Missing recipient_id or content"}, status_code=400)
+            
+            recipient_id = parse_guid(recipient_id)
+            if recipient_id is None:
+                return JSONResponse({"error": "Invalid recipient_id"}, status_code=400)
                 
-            # Create Message
-            msg = ChatMessage(
-                sender_id=current_user.id,
-                receiver_id=recipient_id,
-                message_body=content,
-                created_at=datetime.utcnow(),
-                is_read=False
-            )
-            db.add(msg)
+            # Create Message (through the repository so the recipient's
+            # unread counter is kept in step)
+            msg = ChatRepository(db).create({
+                "sender_id": current_user.id,
+                "receiver_id": recipient_id,
+                "message_body": content,
+                "created_at": datetime.utcnow(),
+                "is_read": False
+            })
             db.commit()
             
             # Send SSE Notification
@@ -107,7 +118,7 @@ def register_chat_routes(app):
                         "id": msg.id,
                         "text": msg.message_body,
                         "sender_id": current_user.id,
-                        "time": msg.created_at.strftime("%I:%M %p"),
+                        "time": time_label(msg.created_at),
                         "is_me": False  # Recipient sees it as not 'me'
                     }
                 )
@@ -119,7 +130,7 @@ def register_chat_routes(app):
                 "message": {
                     "id": msg.id,
                     "text": msg.message_body,
-                    "time": msg.created_at.strftime("%I:%M %p"),
+                    "time": time_label(msg.created_at),
                     "is_me": True
                 }
             })
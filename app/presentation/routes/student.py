@@ -3,18 +3,22 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from datetime import date, datetime, timedelta
 from app.domain.models.user import User, UserRole
-from app.infrastructure.security.session import require_auth, require_role
+from app.infrastructure.security.session import UserView, auth
 from app.domain.models.log import LogStatus
 from app.application.services.log import LogService
 from app.presentation.components.domain.student.dashboard import StudentDashboard
-from app.presentation.components.domain.student.logbook import LogbookPage, WeekCard, LogEntryModalBody, FilterTabs
-from app.presentation.components.domain.student.communication import CommunicationPage
+from app.presentation.components.domain.student.logbook import LogbookPage, WeekCards, LogEntryModalBody, FilterTabs
+from app.presentation.components.domain.student.communication import CommunicationPage, CommunicationTabs, CommunicationContent, ChatMessageItem
 from app.presentation.components.domain.student.profile import StudentProfilePage
 from app.presentation.components.ui.layouts import DashboardLayout
 from app.presentation.components.ui.navigation import StudentSidebarNav, StudentBottomNav
+from app.presentation.components.shared.formatting import time_label
 from app.infrastructure.repositories.placement import PlacementRepository
 from app.application.services.sync import SyncService
 
+# Most recent chat messages rendered on the communication page
+CHAT_HISTORY_LIMIT = 50
+
 
 def setup_student_routes(app: FastHTML):
     """Setup student routes.
@@ -24,9 +28,8 @@ def setup_student_routes(app: FastHTML):
     """
     
     @app.get("/student/dashboard")
-    @require_auth()
-    @require_role(UserRole.STUDENT)
-    def student_dashboard(request: Request, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.STUDENT)
+    def student_dashboard(request: Request, db: Session = None, current_user: Optional[UserView] = None):
         """Student dashboard page.
         
         Args:
@@ -50,9 +53,8 @@ def setup_student_routes(app: FastHTML):
         )
     
     @app.get("/student/communication")
-    @require_auth()
-    @require_role(UserRole.STUDENT)
-    def student_communication(request: Request, tab: str = "chat", db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.STUDENT)
+    def student_communication(request: Request, tab: str = "chat", db: Session = None, current_user: Optional[UserView] = None):
         """Student communication page.
         
         Args:
@@ -65,7 +67,6 @@ def setup_student_routes(app: FastHTML):
         """
         # Check if HTMX request (partial update)
         if request.headers.get("HX-Request"):
-            from app.presentation.components.domain.student.communication import CommunicationTabs, CommunicationContent
             return (
                 CommunicationTabs(active_tab=tab),
                 CommunicationContent(active_tab=tab)
@@ -108,15 +109,16 @@ def setup_student_routes(app: FastHTML):
                     and_(ChatMessage.sender_id == current_user.id, ChatMessage.receiver_id == sup_id),
                     and_(ChatMessage.sender_id == sup_id, ChatMessage.receiver_id == current_user.id)
                 )
-            ).order_by(ChatMessage.created_at.asc()).all()
+            ).order_by(ChatMessage.created_at.desc()).limit(CHAT_HISTORY_LIMIT).all()
             
+            # Latest messages were fetched newest first; display oldest first
             messages = [
-                {
-                    "text": m.message_body,
-                    "time": m.created_at.strftime("%I:%M %p"),
-                    "is_me": m.sender_id == current_user.id
-                }
-                for m in chat_logs
+                ChatMessageItem(
+                    m.message_body,
+                    time_label(m.created_at),
+                    m.sender_id == current_user.id
+                )
+                for m in reversed(chat_logs)
             ]
 
         # Full page load
@@ -129,9 +131,8 @@ def setup_student_routes(app: FastHTML):
         )
     
     @app.get("/student/profile")
-    @require_auth()
-    @require_role(UserRole.STUDENT)
-    def student_profile(request: Request, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.STUDENT)
+    def student_profile(request: Request, db: Session = None, current_user: Optional[UserView] = None):
         """Student profile page.
         
         Args:
@@ -188,9 +189,8 @@ def setup_student_routes(app: FastHTML):
         )
 
     @app.get("/student/logbook")
-    @require_auth()
-    @require_role(UserRole.STUDENT)
-    def student_logbook(request: Request, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.STUDENT)
+    def student_logbook(request: Request, db: Session = None, current_user: Optional[UserView] = None):
         """Student logbook page with week cards.
         
         Args:
@@ -216,9 +216,8 @@ def setup_student_routes(app: FastHTML):
         )
     
     @app.get("/student/logbook/day/{day_date}")
-    @require_auth()
-    @require_role(UserRole.STUDENT)
-    def get_log_modal(request: Request, day_date: str, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.STUDENT)
+    def get_log_modal(request: Request, day_date: str, db: Session = None, current_user: Optional[UserView] = None):
         """Get modal body content for a specific day.
         
         Args:
@@ -235,9 +234,8 @@ def setup_student_routes(app: FastHTML):
         return LogEntryModalBody(date=day_date, existing_log=existing_log)
     
     @app.post("/student/logbook/create")
-    @require_auth()
-    @require_role(UserRole.STUDENT)
-    async def create_log_entry(request: Request, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.STUDENT)
+    async def create_log_entry(request: Request, db: Session = None, current_user: Optional[UserView] = None):
         """Create a new log entry.
         
         Args:
@@ -306,9 +304,8 @@ def setup_student_routes(app: FastHTML):
             )
 
     @app.post("/student/logbook/sync")
-    @require_auth()
-    @require_role(UserRole.STUDENT)
-    async def sync_offline_entry(request: Request, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.STUDENT)
+    async def sync_offline_entry(request: Request, db: Session = None, current_user: Optional[UserView] = None):
         """Sync a single offline log entry (JSON)."""
         data = await request.json()
         
@@ -344,9 +341,8 @@ def setup_student_routes(app: FastHTML):
             return JSONResponse({"error": str(e)}, status_code=500)
     
     @app.get("/student/logbook/filter/{filter_type}")
-    @require_auth()
-    @require_role(UserRole.STUDENT)
-    def filter_weeks(request: Request, filter_type: str, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.STUDENT)
+    def filter_weeks(request: Request, filter_type: str, db: Session = None, current_user: Optional[UserView] = None):
         """Filter weeks by type (HTMX endpoint).
         
         Args:
@@ -361,7 +357,7 @@ def setup_student_routes(app: FastHTML):
         
         return (
             FilterTabs(active_filter=filter_type, oob=True),
-            *[WeekCard(week["number"], week["start_date"], week["days"]) for week in weeks_data]
+            WeekCards(weeks_data)
         )
 
 
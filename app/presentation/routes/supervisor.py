@@ -3,13 +3,15 @@
 from fasthtml.common import *
 from typing import Optional
 from sqlalchemy.orm import Session
+from app.domain.models.base import parse_guid
 from app.domain.models.user import User, UserRole
-from app.infrastructure.security.session import require_auth, require_role
+from app.infrastructure.security.session import UserView, auth
 from app.presentation.components.domain.supervisor.dashboard import SupervisorDashboard
 from app.presentation.components.domain.supervisor.geofencing import GeofencingPage
 from app.presentation.components.domain.supervisor.logs import StudentLogsPage, LogCard, LogFilterTabs, LogReviewPage
 from app.presentation.components.ui.layouts import DashboardLayout
 from app.presentation.components.ui.navigation import SupervisorSidebarNav, SupervisorBottomNav
+from app.presentation.components.shared.formatting import time_label
 
 
 def setup_supervisor_routes(app: FastHTML):
@@ -20,9 +22,8 @@ def setup_supervisor_routes(app: FastHTML):
     """
     
     @app.get("/supervisor/dashboard")
-    @require_auth()
-    @require_role(UserRole.SUPERVISOR)
-    def supervisor_dashboard(request: Request, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.SUPERVISOR)
+    def supervisor_dashboard(request: Request, db: Session = None, current_user: Optional[UserView] = None):
         """Supervisor dashboard page.
         
         Args:
@@ -41,9 +42,8 @@ def setup_supervisor_routes(app: FastHTML):
         )
     
     @app.get("/supervisor/geofencing")
-    @require_auth()
-    @require_role(UserRole.SUPERVISOR)
-    def supervisor_geofencing(request: Request, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.SUPERVISOR)
+    def supervisor_geofencing(request: Request, db: Session = None, current_user: Optional[UserView] = None):
         """Supervisor geofencing map page.
         
         Args:
@@ -62,9 +62,8 @@ def setup_supervisor_routes(app: FastHTML):
         )
     
     @app.get("/supervisor/logs")
-    @require_auth()
-    @require_role(UserRole.SUPERVISOR)
-    def supervisor_logs(request: Request, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.SUPERVISOR)
+    def supervisor_logs(request: Request, db: Session = None, current_user: Optional[UserView] = None):
         """Supervisor student logs review page.
         
         Args:
@@ -83,9 +82,8 @@ def setup_supervisor_routes(app: FastHTML):
         )
 
     @app.get("/supervisor/logs/filter/{filter_key}")
-    @require_auth()
-    @require_role(UserRole.SUPERVISOR)
-    def filter_logs(request: Request, filter_key: str, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.SUPERVISOR)
+    def filter_logs(request: Request, filter_key: str, db: Session = None, current_user: Optional[UserView] = None):
         """Filter logs and update tabs.
         
         Args:
@@ -116,9 +114,8 @@ def setup_supervisor_routes(app: FastHTML):
         )
 
     @app.get("/supervisor/logs/review/{log_id}")
-    @require_auth()
-    @require_role(UserRole.SUPERVISOR)
-    def review_log(request: Request, log_id: str, db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.SUPERVISOR)
+    def review_log(request: Request, log_id: str, db: Session = None, current_user: Optional[UserView] = None):
         """Show detailed review page.
         
         Args:
@@ -132,9 +129,8 @@ def setup_supervisor_routes(app: FastHTML):
         return LogReviewPage(log_id)
         
     @app.get("/supervisor/communication")
-    @require_auth()
-    @require_role(UserRole.SUPERVISOR)
-    def supervisor_communication(request: Request, tab: str = "chat", db: Session = None, current_user: Optional[User] = None):
+    @auth(UserRole.SUPERVISOR)
+    def supervisor_communication(request: Request, tab: str = "chat", db: Session = None, current_user: Optional[UserView] = None):
         """Supervisor communication page.
         
         Args:
@@ -178,7 +174,7 @@ def setup_supervisor_routes(app: FastHTML):
                 })
         
         # Handle active student
-        active_student_id = request.query_params.get("student_id")
+        active_student_id = parse_guid(request.query_params.get("student_id", ""))
         current_student = None
         
         if active_student_id and students_data:
@@ -214,7 +210,7 @@ def setup_supervisor_routes(app: FastHTML):
             messages = [
                 {
                     "text": m.message_body,
-                    "time": m.created_at.strftime("%I:%M %p"),
+                    "time": time_label(m.created_at),
                     "sender": "me" if m.sender_id == current_user.id else "them"
                 }
                 for m in chat_logs
@@ -0,0 +1,75 @@
+"""Migration script to convert VARCHAR(36) id and foreign key columns to UUID.
+
+Only PostgreSQL databases created before the GUID column type need this;
+SQLite keeps storing ids as CHAR(36).
+"""
+from sqlalchemy import text
+from app.domain.models import Base, GUID
+from app.infrastructure.database.connection import engine
+
+COLUMN_TYPE_SQL = text("""
+    SELECT data_type
+    FROM information_schema.columns
+    WHERE table_name = :table AND column_name = :column
+""")
+
+# Foreign keys on, or pointing at, the tables being converted
+FOREIGN_KEYS_SQL = text("""
+    SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid)
+    FROM pg_constraint
+    WHERE contype = 'f'
+      AND (conrelid::regclass::text = ANY(:tables)
+           OR confrelid::regclass::text = ANY(:tables))
+""")
+
+def guid_columns():
+    """Every (table, column) the models declare with the GUID type."""
+    return [
+        (table.name, column.name)
+        for table in Base.metadata.sorted_tables
+        for column in table.columns
+        if isinstance(column.type, GUID)
+    ]
+
+def convert_ids_to_uuid():
+    if engine.dialect.name != "postgresql":
+        print("Not a PostgreSQL database; ids stay CHAR(36).")
+        return
+
+    try:
+        # One transaction: the keys and their foreign keys change together
+        with engine.begin() as conn:
+            pending = []
+            for table, column in guid_columns():
+                data_type = conn.execute(
+                    COLUMN_TYPE_SQL, {"table": table, "column": column}
+                ).scalar()
+                if data_type is not None and data_type != "uuid":
+                    pending.append((table, column))
+
+            if not pending:
+                print("All id columns are already UUID.")
+                return
+
+            # Constraints can't span a varchar and a uuid column, so drop the
+            # affected foreign keys while the types change and re-add them after
+            tables = sorted({table for table, _ in pending})
+            foreign_keys = conn.execute(FOREIGN_KEYS_SQL, {"tables": tables}).all()
+            for table, name, _ in foreign_keys:
+                conn.execute(text(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"'))
+
+            for table, column in pending:
+                print(f"Converting {table}.{column} to UUID...")
+                conn.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING {column}::uuid"
+                ))
+
+            for table, name, definition in foreign_keys:
+                conn.execute(text(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}'))
+
+        print(f"Converted {len(pending)} columns to UUID.")
+    except Exception as e:
+        print(f"Error converting id columns: {e}")
+
+if __name__ == "__main__":
+    convert_ids_to_uuid()
@@ -10,6 +10,7 @@ import sys
 from fasthtml.common import *
 from starlette.middleware import Middleware
 from app.infrastructure.database.middleware import DBSessionMiddleware
+from app.infrastructure.services.daily_client import close_daily_client
 from faststrap import add_bootstrap, mount_assets
 from faststrap.pwa import add_pwa
 from app.config import get_settings
@@ -25,7 +26,8 @@ settings = get_settings()
 app = FastHTML(
     secret_key=settings.secret_key,
     session_cookie="siwes_session",
-    middleware=[Middleware(DBSessionMiddleware)]
+    middleware=[Middleware(DBSessionMiddleware)],
+    on_shutdown=[close_daily_client]
 )
 
 # Apply Faststrap theme
@@ -54,6 +56,7 @@ app.hdrs = app.hdrs + [
     Script(src="/assets/sync_manager.js"),
     Script(src="/assets/video_call.js"),
     Script(src="/assets/chat_manager.js"),
+    Script(src="/assets/logbook_modal.js"),
 ]
 
 # Setup component defaults